@@ -250,11 +250,12 @@ def main():
     bias_detector = BiasDetector()
     
     # Analyze developer treatment
-    developer_treatments = bias_detector.analyze_developer_treatment(analysis_result.all_comments)
+    comment_index = bias_detector.index_comments(analysis_result.all_comments)
+    developer_treatments = bias_detector.analyze_developer_treatment(analysis_result.all_comments, comment_index)
     analysis_result.developer_treatment = developer_treatments
     
     # Calculate bias indicators
-    bias_analysis = bias_detector.calculate_bias_indicators(analysis_result.all_comments)
+    bias_analysis = bias_detector.calculate_bias_indicators(analysis_result.all_comments, comment_index)
     analysis_result.bias_analysis = bias_analysis
     
     # Generate report
@@ -122,11 +122,14 @@ def run_analysis(args: argparse.Namespace, config: Dict[str, str]) -> AnalysisRe
     if args.team_report:
         print("📊 Generating team-wide analysis...")
         # Analyze developer treatment
-        developer_treatments = bias_detector.analyze_developer_treatment(all_comments)
+        comment_index = bias_detector.index_comments(all_comments)
+        developer_treatments = bias_detector.analyze_developer_treatment(
+            all_comments, comment_index, max_workers=args.workers
+        )
         analysis_result.developer_treatment = developer_treatments
         
         # Calculate bias indicators
-        bias_analysis = bias_detector.calculate_bias_indicators(all_comments)
+        bias_analysis = bias_detector.calculate_bias_indicators(all_comments, comment_index)
         analysis_result.bias_analysis = bias_analysis
         
         print(f"   Analyzed {len(developer_treatments)} developers")
@@ -195,11 +198,14 @@ def run_analysis(args: argparse.Namespace, config: Dict[str, str]) -> AnalysisRe
         analysis_result.reviewer_stats = reviewer_stats
         
         # Also run developer treatment analysis for comparison
-        developer_treatments = bias_detector.analyze_developer_treatment(all_comments)
+        comment_index = bias_detector.index_comments(all_comments)
+        developer_treatments = bias_detector.analyze_developer_treatment(
+            all_comments, comment_index, max_workers=args.workers
+        )
         analysis_result.developer_treatment = developer_treatments
         
         # Calculate bias indicators
-        bias_analysis = bias_detector.calculate_bias_indicators(all_comments)
+        bias_analysis = bias_detector.calculate_bias_indicators(all_comments, comment_index)
         analysis_result.bias_analysis = bias_analysis
         
         print(f"   Analyzed {len(reviewer_comments)} comments by {args.reviewer_name}")
@@ -242,6 +248,13 @@ def main() -> int:
         action="store_true",
         help="Generate a comprehensive team report instead of individual analysis"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for developer analysis and chart rendering "
+             "(default: one per CPU for large teams; 1 disables)"
+    )
     
     args = parser.parse_args()
     
@@ -267,7 +280,8 @@ def main() -> int:
         report_generator = ReportGenerator()
         output_file = report_generator.generate_report(
             analysis_result=analysis_result,
-            output_file=args.output
+            output_file=args.output,
+            max_workers=args.workers
         )
         
         print(f"\n✅ Report generated: {output_file}")
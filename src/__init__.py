@@ -15,7 +15,8 @@ from .models import (
     ProjectMetrics,
     BehaviorPattern,
     DeveloperBehaviorAnalysis,
-    ReviewComment
+    ReviewComment,
+    ReviewCommentFrame
 )
 
 __version__ = "2.0.0"
@@ -32,7 +33,8 @@ __all__ = [
     'ProjectMetrics',
     'BehaviorPattern',
     'DeveloperBehaviorAnalysis',
-    'ReviewComment'
+    'ReviewComment',
+    'ReviewCommentFrame'
 ]
 
 # Backward compatibility
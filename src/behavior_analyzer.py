@@ -2,11 +2,13 @@
 Advanced behavior analysis for identifying negative review patterns and developer treatment.
 """
 import re
-import statistics
-from typing import Dict, List, Any, Tuple
+from statistics import fmean
+from typing import Dict, List, Any, Optional, Tuple
 from collections import defaultdict, Counter
 from datetime import datetime, timedelta
 
+import numpy as np
+
 try:
     # Try relative imports first (when used as package)
     from .models import DeveloperMetrics, BehaviorPattern, DeveloperBehaviorAnalysis, ReviewComment
@@ -14,6 +16,53 @@ except ImportError:
     # Fall back to absolute imports (when used directly)
     from models import DeveloperMetrics, BehaviorPattern, DeveloperBehaviorAnalysis, ReviewComment
 
+# Keywords identifying why an MR was blocked, in priority order
+_BLOCKING_REASON_KEYWORDS = {
+    'code_quality': ['quality', 'standards', 'clean', 'refactor', 'design'],
+    'testing': ['test', 'coverage', 'unit test', 'integration'],
+    'documentation': ['docs', 'documentation', 'comment', 'readme'],
+    'security': ['security', 'vulnerability', 'auth', 'permission'],
+    'performance': ['performance', 'slow', 'optimization', 'memory'],
+    'style': ['style', 'formatting', 'lint', 'convention'],
+    'unclear': ['unclear', 'confusing', 'understand', 'explain']
+}
+
+# One alternation per reason, so each category costs a single scan of the body
+_BLOCKING_REASON_PATTERNS = [
+    (reason, re.compile('|'.join(map(re.escape, keywords))))
+    for reason, keywords in _BLOCKING_REASON_KEYWORDS.items()
+]
+
+# Integer codes for blocking-comment categories, used for histogramming
+_BLOCKING_REASONS = tuple(_BLOCKING_REASON_KEYWORDS) + ('other',)
+_SEVERITY_LEVELS = ('low', 'medium', 'high')
+_REASON_CODES = {name: code for code, name in enumerate(_BLOCKING_REASONS)}
+_SEVERITY_CODES = {name: code for code, name in enumerate(_SEVERITY_LEVELS)}
+_HIGH_SEVERITY = _SEVERITY_CODES['high']
+
+_CRITICAL_TREATMENTS = frozenset({'Critical', 'Very Critical', 'Potentially Toxic'})
+
+
+def _compile_keyword_counter(keyword_groups: List[List[str]]):
+    """Generate a function counting, per group, the keywords contained in a text.
+    
+    The membership tests are unrolled into straight-line code so each check is a
+    single CONTAINS_OP instead of an interpreted loop over the keyword list.
+    Duplicate keywords are counted once per occurrence in their group, matching
+    ``sum(1 for kw in group if kw in text)``.
+    """
+    lines = ["def count_keywords(text):"]
+    for index, keywords in enumerate(keyword_groups):
+        lines.append(f"    c{index} = 0")
+        for keyword in keywords:
+            lines.append(f"    if {keyword!r} in text: c{index} += 1")
+    counters = ", ".join(f"c{index}" for index in range(len(keyword_groups)))
+    lines.append(f"    return ({counters},)")
+    
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace['count_keywords']
+
 
 class BehaviorAnalyzer:
     """Analyzes developer behavior patterns for negative tendencies and bias detection."""
@@ -36,6 +85,10 @@ class BehaviorAnalyzer:
             'would', 'perhaps', 'how about', 'what if', 'alternative'
         ]
         
+        self.personal_attack_phrases = [
+            'you are', 'you\'re', 'your fault', 'you did', 'you made'
+        ]
+        
         self.praise_keywords = [
             'good', 'great', 'excellent', 'nice', 'well', 'perfect', 'awesome',
             'brilliant', 'clever', 'smart', 'elegant', 'clean', 'beautiful'
@@ -47,11 +100,19 @@ class BehaviorAnalyzer:
         self.negative_sentiment_threshold = -0.2
         self.toxicity_threshold = 0.7
         
+        # Specialized scorer for the fixed toxicity keyword lists
+        self._count_toxicity_keywords = _compile_keyword_counter([
+            self.negative_comment_keywords,
+            self.personal_attack_phrases,
+            self.constructive_keywords
+        ])
+        
     def analyze_developer_treatment(self, all_comments: List) -> Dict:
         """Analyze how each developer is treated by different reviewers."""
         developer_analysis = {}
         
-        # Group comments by MR author (developer)
+        # Group comments by MR author (developer) in a single pass; developers
+        # are reported in order of first appearance
         comments_by_developer = defaultdict(list)
         for comment in all_comments:
             comments_by_developer[comment.mr_author].append(comment)
@@ -69,6 +130,8 @@ class BehaviorAnalyzer:
         reviewer_actions = defaultdict(lambda: {'approved': 0, 'requested_changes': 0, 'commented': 0})
         reviewer_toxicity = defaultdict(list)
         reviewer_blocking_behavior = defaultdict(list)
+        # Constructiveness of each change request, scored once and reused below
+        change_request_scores = []
         
         for comment in comments:
             reviewer = comment.author
@@ -78,17 +141,19 @@ class BehaviorAnalyzer:
             
             # Track blocking behavior patterns
             if comment.approval_status == 'requested_changes':
+                constructiveness = self._assess_constructiveness(comment.body)
+                change_request_scores.append(constructiveness)
                 reviewer_blocking_behavior[reviewer].append({
                     'reason': self._extract_blocking_reason(comment.body),
                     'severity': self._assess_blocking_severity(comment.body),
-                    'constructiveness': self._assess_constructiveness(comment.body)
+                    'constructiveness': constructiveness
                 })
         
         # Calculate reviewer statistics
         reviewer_stats = {}
         for reviewer, sentiments in reviewer_sentiments.items():
-            avg_sentiment = sum(sentiments) / len(sentiments)
-            avg_toxicity = sum(reviewer_toxicity[reviewer]) / len(reviewer_toxicity[reviewer])
+            avg_sentiment = fmean(sentiments)
+            avg_toxicity = fmean(reviewer_toxicity[reviewer])
             actions = reviewer_actions[reviewer]
             total_reviews = sum(actions.values())
             
@@ -110,7 +175,7 @@ class BehaviorAnalyzer:
                 'approval_rate': actions['approved'] / total_reviews if total_reviews > 0 else 0,
                 'change_request_rate': actions['requested_changes'] / total_reviews if total_reviews > 0 else 0,
                 'blocking_analysis': blocking_analysis,
-                'negative_patterns': self._identify_negative_patterns(reviewer, comments),
+                'negative_patterns': self._identify_negative_patterns(reviewer, comments, change_request_scores),
                 'communication_style': self._determine_communication_style(sentiments, reviewer_toxicity[reviewer])
             }
         
@@ -121,9 +186,10 @@ class BehaviorAnalyzer:
         """Calculate toxicity score for a comment (0-1)."""
         text_lower = text.lower()
         toxicity_score = 0.0
+        negative_count, personal_attack_count, constructive_count = \
+            self._count_toxicity_keywords(text_lower)
         
         # Check for negative keywords
-        negative_count = sum(1 for keyword in self.negative_comment_keywords if keyword in text_lower)
         toxicity_score += negative_count * 0.2
         
         # Check for toxic patterns
@@ -131,31 +197,18 @@ class BehaviorAnalyzer:
         toxicity_score += pattern_matches * 0.3
         
         # Check for personal attacks
-        personal_attacks = ['you are', 'you\'re', 'your fault', 'you did', 'you made']
-        personal_attack_count = sum(1 for attack in personal_attacks if attack in text_lower)
         toxicity_score += personal_attack_count * 0.25
         
         # Check for constructive language (reduces toxicity)
-        constructive_count = sum(1 for keyword in self.constructive_keywords if keyword in text_lower)
         toxicity_score -= constructive_count * 0.1
         
         return max(0.0, min(1.0, toxicity_score))
     
     def _extract_blocking_reason(self, comment_body: str) -> str:
         """Extract the main reason for blocking an MR."""
-        reasons = {
-            'code_quality': ['quality', 'standards', 'clean', 'refactor', 'design'],
-            'testing': ['test', 'coverage', 'unit test', 'integration'],
-            'documentation': ['docs', 'documentation', 'comment', 'readme'],
-            'security': ['security', 'vulnerability', 'auth', 'permission'],
-            'performance': ['performance', 'slow', 'optimization', 'memory'],
-            'style': ['style', 'formatting', 'lint', 'convention'],
-            'unclear': ['unclear', 'confusing', 'understand', 'explain']
-        }
-        
         comment_lower = comment_body.lower()
-        for reason, keywords in reasons.items():
-            if any(keyword in comment_lower for keyword in keywords):
+        for reason, pattern in _BLOCKING_REASON_PATTERNS:
+            if pattern.search(comment_lower):
                 return reason
         
         return 'other'
@@ -201,27 +254,39 @@ class BehaviorAnalyzer:
         if not blocking_behaviors:
             return {'frequency': 0, 'patterns': [], 'severity_distribution': {}}
         
-        reasons = [b['reason'] for b in blocking_behaviors]
-        severities = [b['severity'] for b in blocking_behaviors]
-        constructiveness_scores = [b['constructiveness'] for b in blocking_behaviors]
+        # Single pre-pass into small integer-coded arrays
+        count = len(blocking_behaviors)
+        reason_ids = np.fromiter((_REASON_CODES[b['reason']] for b in blocking_behaviors),
+                                 dtype=np.intp, count=count)
+        severity_ids = np.fromiter((_SEVERITY_CODES[b['severity']] for b in blocking_behaviors),
+                                   dtype=np.intp, count=count)
+        constructiveness_scores = np.fromiter((b['constructiveness'] for b in blocking_behaviors),
+                                              dtype=np.float64, count=count)
+        
+        reason_dist = np.bincount(reason_ids, minlength=len(_BLOCKING_REASONS))
+        severity_dist = np.bincount(severity_ids, minlength=len(_SEVERITY_LEVELS))
         
         patterns = []
-        if len(set(reasons)) == 1 and len(reasons) > 2:
-            patterns.append(f"Consistently blocks for {reasons[0]} issues")
+        if np.count_nonzero(reason_dist) == 1 and count > 2:
+            patterns.append(f"Consistently blocks for {_BLOCKING_REASONS[reason_ids[0]]} issues")
         
-        if len([s for s in severities if s == 'high']) > len(severities) * 0.6:
+        if severity_dist[_HIGH_SEVERITY] > count * 0.6:
             patterns.append("Tends to escalate issues to high severity")
         
-        avg_constructiveness = sum(constructiveness_scores) / len(constructiveness_scores)
+        avg_constructiveness = float(constructiveness_scores.mean())
         if avg_constructiveness < 40:
             patterns.append("Blocking comments lack constructive feedback")
         
         return {
-            'frequency': len(blocking_behaviors),
+            'frequency': count,
             'patterns': patterns,
-            'severity_distribution': dict(Counter(severities)),
+            'severity_distribution': {
+                _SEVERITY_LEVELS[code]: int(n) for code, n in enumerate(severity_dist) if n
+            },
             'avg_constructiveness': avg_constructiveness,
-            'common_reasons': dict(Counter(reasons))
+            'common_reasons': {
+                _BLOCKING_REASONS[code]: int(n) for code, n in enumerate(reason_dist) if n
+            }
         }
     
     def _determine_treatment_level(self, avg_sentiment: float, avg_toxicity: float, 
@@ -256,13 +321,17 @@ class BehaviorAnalyzer:
         else:
             return {'level': 'Potentially Toxic', 'color': '#e74c3c', 'icon': '🚨'}
     
-    def _identify_negative_patterns(self, reviewer: str, comments: List) -> List[str]:
-        """Identify specific negative patterns in reviewer behavior."""
+    def _identify_negative_patterns(self, reviewer: str, comments: List,
+                                    change_request_scores: Optional[List[int]] = None) -> List[str]:
+        """Identify specific negative patterns in reviewer behavior.
+        
+        ``change_request_scores`` holds the precomputed constructiveness of each
+        change request in ``comments``; it is computed here when not supplied.
+        """
         patterns = []
         
         # Analyze comment sentiments
-        sentiments = [comment.sentiment_textblob for comment in comments]
-        avg_sentiment = sum(sentiments) / len(sentiments)
+        avg_sentiment = fmean(comment.sentiment_textblob for comment in comments)
         
         if avg_sentiment < -0.3:
             patterns.append("Consistently negative sentiment in reviews")
@@ -272,34 +341,35 @@ class BehaviorAnalyzer:
         for comment in comments:
             comment_counts_per_mr[comment.mr_title] += 1
         
-        excessive_comment_mrs = [count for count in comment_counts_per_mr.values() 
-                               if count > self.excessive_comment_threshold]
-        if len(excessive_comment_mrs) > len(comment_counts_per_mr) * 0.3:
+        excessive_comment_mrs = sum(1 for count in comment_counts_per_mr.values()
+                                    if count > self.excessive_comment_threshold)
+        if excessive_comment_mrs > len(comment_counts_per_mr) * 0.3:
             patterns.append("Tends to over-comment on merge requests")
         
         # Check for nitpicking behavior
-        short_critical_comments = [
-            comment for comment in comments 
+        short_critical_comments = sum(
+            1 for comment in comments
             if len(comment.body) < 50 and comment.sentiment_textblob < -0.2
-        ]
-        if len(short_critical_comments) > len(comments) * 0.4:
+        )
+        if short_critical_comments > len(comments) * 0.4:
             patterns.append("Shows nitpicking behavior with short critical comments")
         
         # Check for blocking behavior without constructive feedback
-        change_requests = [comment for comment in comments if comment.approval_status == 'requested_changes']
-        low_constructiveness_blocks = [
-            comment for comment in change_requests 
-            if self._assess_constructiveness(comment.body) < 40
-        ]
-        if len(low_constructiveness_blocks) > len(change_requests) * 0.5:
+        if change_request_scores is None:
+            change_request_scores = [
+                self._assess_constructiveness(comment.body) for comment in comments
+                if comment.approval_status == 'requested_changes'
+            ]
+        low_constructiveness_blocks = sum(1 for score in change_request_scores if score < 40)
+        if low_constructiveness_blocks > len(change_request_scores) * 0.5:
             patterns.append("Blocks MRs without providing constructive feedback")
         
         return patterns
     
     def _determine_communication_style(self, sentiments: List[float], toxicity_scores: List[float]) -> str:
         """Determine overall communication style."""
-        avg_sentiment = sum(sentiments) / len(sentiments)
-        avg_toxicity = sum(toxicity_scores) / len(toxicity_scores)
+        avg_sentiment = fmean(sentiments)
+        avg_toxicity = fmean(toxicity_scores)
         
         if avg_sentiment > 0.2 and avg_toxicity < 0.2:
             return "Encouraging & Constructive"
@@ -314,8 +384,7 @@ class BehaviorAnalyzer:
     
     def _compile_developer_analysis(self, developer: str, comments: List, reviewer_stats: Dict) -> Dict:
         """Compile comprehensive analysis for a developer."""
-        all_sentiments = [comment.sentiment_textblob for comment in comments]
-        overall_sentiment = sum(all_sentiments) / len(all_sentiments)
+        overall_sentiment = fmean(comment.sentiment_textblob for comment in comments)
         
         # Find most and least supportive reviewers
         if reviewer_stats:
@@ -330,14 +399,13 @@ class BehaviorAnalyzer:
             if sentiment_range > 0.6:
                 bias_indicators.append("Very inconsistent treatment from different reviewers")
             
-            critical_reviewers = [r for r in reviewer_stats.values() 
-                                if r['treatment'] in ['Critical', 'Very Critical', 'Potentially Toxic']]
-            if len(critical_reviewers) > len(reviewer_stats) * 0.5:
+            critical_reviewers = sum(1 for r in reviewer_stats.values()
+                                     if r['treatment'] in _CRITICAL_TREATMENTS)
+            if critical_reviewers > len(reviewer_stats) * 0.5:
                 bias_indicators.append("Majority of reviewers are critical")
             
             # Check for potential targeting
-            high_toxicity_reviewers = [r for r in reviewer_stats.values() if r['avg_toxicity'] > 0.5]
-            if len(high_toxicity_reviewers) > 0:
+            if any(r['avg_toxicity'] > 0.5 for r in reviewer_stats.values()):
                 bias_indicators.append("Some reviewers show toxic behavior patterns")
             
             # Calculate bias risk
@@ -360,7 +428,7 @@ class BehaviorAnalyzer:
     
     def _generate_treatment_summary(self, reviewer_stats: Dict) -> Dict:
         """Generate a summary of how the developer is treated."""
-        treatment_counts = Counter([stats['treatment'] for stats in reviewer_stats.values()])
+        treatment_counts = Counter(stats['treatment'] for stats in reviewer_stats.values())
         total_reviewers = len(reviewer_stats)
         
         return {
@@ -388,8 +456,8 @@ class BehaviorAnalyzer:
             recommendations.append(f"⚠️ Address toxic behavior from: {', '.join(toxic_reviewers)}")
         
         # Check for inconsistent treatment
-        sentiment_range = max([stats['avg_sentiment'] for stats in reviewer_stats.values()]) - \
-                         min([stats['avg_sentiment'] for stats in reviewer_stats.values()])
+        sentiment_range = max(stats['avg_sentiment'] for stats in reviewer_stats.values()) - \
+                         min(stats['avg_sentiment'] for stats in reviewer_stats.values())
         if sentiment_range > 0.6:
             recommendations.append("📊 Work on standardizing review feedback across the team")
         
@@ -5,16 +5,150 @@ This module provides advanced algorithms for detecting bias patterns in code rev
 identifying negative behavior, and generating actionable recommendations.
 """
 
-import statistics
+import re
 from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Tuple, Any, Set, Optional
 
+import numpy as np
+
 from data_models import (
     ReviewComment, BehaviorPattern, DeveloperTreatment, 
-    BiasRiskLevel, SeverityLevel, BiasAnalysis
+    BiasRiskLevel, SeverityLevel, BiasAnalysis, ApprovalStatus
+)
+from worker_pool import resolve_max_workers
+
+# Integer codes for approval statuses, in ApprovalStatus declaration order
+_APPROVAL_STATUSES = tuple(status.value for status in ApprovalStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(_APPROVAL_STATUSES)}
+_APPROVED = _STATUS_CODES[ApprovalStatus.APPROVED.value]
+_REQUESTED_CHANGES = _STATUS_CODES[ApprovalStatus.REQUESTED_CHANGES.value]
+
+# Integer codes for blocking comment severities
+_SEVERITY_LEVELS = ('low', 'medium', 'high')
+_LOW_SEVERITY, _MEDIUM_SEVERITY, _HIGH_SEVERITY = range(len(_SEVERITY_LEVELS))
+
+# Negative behavior categories, in the order they are reported
+_NEGATIVE_BEHAVIOR_CATEGORIES = (
+    "Toxic language",
+    "Personal criticism",
+    "Non-constructive feedback",
+    "Dismissive comment"
+)
+
+# Reviewer treatment levels from least to most supportive; a composite score
+# earns the level indexed by how many thresholds it reaches
+_TREATMENT_THRESHOLDS = np.array([-0.5, -0.3, -0.1, 0.1, 0.3])
+_TREATMENT_LEVELS = (
+    {'level': 'Potentially Toxic', 'color': '#e74c3c', 'icon': '🚨'},
+    {'level': 'Very Critical', 'color': '#e67e22', 'icon': '😠'},
+    {'level': 'Critical', 'color': '#f39c12', 'icon': '🤨'},
+    {'level': 'Neutral', 'color': '#95a5a6', 'icon': '😐'},
+    {'level': 'Supportive', 'color': '#2ecc71', 'icon': '😊'},
+    {'level': 'Very Supportive', 'color': '#27ae60', 'icon': '🤗'},
 )
 
+# Number of distinct comment bodies whose features are memoized per detector
+_SCORE_CACHE_SIZE = 8192
+
+# Number of hit counts returned by BiasDetector._body_features
+_BODY_FEATURES = 8
+
+
+@dataclass
+class CommentIndex:
+    """Comments grouped and unpacked once for the team-wide analyses.
+    
+    Built by BiasDetector.index_comments and shared between
+    analyze_developer_treatment and calculate_bias_indicators so the
+    comment list is only traversed once.
+    """
+    by_mr_author: Dict[str, List[ReviewComment]]
+    mr_author_codes: np.ndarray
+    sentiments: np.ndarray
+
+
+class _KeywordScanner:
+    """Counts keyword hits for several keyword categories in a single pass.
+    
+    ``scan(text)[category]`` equals ``sum(1 for kw in keywords if kw in text)``
+    for each category's keyword list, but the text is walked once by a single
+    compiled regex instead of once per keyword.
+    """
+    
+    def __init__(self, categories: Dict[str, List[str]]):
+        """Build the scanner.
+        
+        Args:
+            categories: Mapping of category name to its keyword list
+        """
+        memberships = defaultdict(Counter)
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                memberships[keyword][category] += 1
+        keywords = list(memberships)
+        
+        # Longest alternatives first: at every position the lookahead reports the
+        # longest keyword starting there; any shorter keyword starting at the same
+        # position is a prefix of it and is recovered through the implied sets below
+        alternation = '|'.join(map(re.escape, sorted(keywords, key=len, reverse=True)))
+        self._regex = re.compile(f'(?=({alternation}))')
+        self._implied = {
+            keyword: [other for other in keywords if other in keyword]
+            for keyword in keywords
+        }
+        self._memberships = dict(memberships)
+        
+        # Highest-priority category (earliest in definition order) implied by
+        # each longest hit, for first-match lookups
+        self._categories = list(categories)
+        rank = {category: i for i, category in enumerate(self._categories)}
+        self._first_rank = {
+            keyword: min(rank[category] for implied in self._implied[keyword]
+                         for category in self._memberships[implied])
+            for keyword in keywords
+        }
+    
+    def scan(self, text: str) -> Counter:
+        """Count the keywords of each category contained in text.
+        
+        Args:
+            text: Text to scan (already lowercased)
+            
+        Returns:
+            Counter mapping category names to keyword hit counts
+        """
+        longest_hits = {match.group(1) for match in self._regex.finditer(text)}
+        present = set()
+        for keyword in longest_hits:
+            present.update(self._implied[keyword])
+        
+        counts = Counter()
+        for keyword in present:
+            counts.update(self._memberships[keyword])
+        return counts
+    
+    def first_index(self, text: str) -> int:
+        """Find the first category, in definition order, with a keyword in text.
+        
+        Args:
+            text: Text to scan (already lowercased)
+            
+        Returns:
+            Index of the category, or the number of categories if no keyword
+            occurs in text
+        """
+        best = len(self._categories)
+        for match in self._regex.finditer(text):
+            rank = self._first_rank[match.group(1)]
+            if rank < best:
+                best = rank
+                if best == 0:
+                    break
+        return best
+
 
 class BiasDetector:
     """Detects bias patterns in code review behavior."""
@@ -39,33 +173,125 @@ class BiasDetector:
             r'\bbad\b.*\bcode\b', r'\bwrong\b.*\bway\b', r'\bhate\b.*\bthis\b',
             r'\bterrible\b.*\bimplementation\b', r'\bwhat.*\bwrong.*\byou\b'
         ]
+        self._toxic_regexes = [re.compile(pattern) for pattern in self.toxic_patterns]
         
         self.constructive_keywords = [
             'suggest', 'recommend', 'consider', 'try', 'maybe', 'could',
             'would', 'perhaps', 'how about', 'what if', 'alternative'
         ]
+        
+        self.personal_attack_phrases = ['you are', 'you\'re', 'your fault', 'you did', 'you made']
+        
+        # Keywords for classifying blocking (change request) comments
+        self.blocking_reason_keywords = {
+            'code_quality': ['quality', 'standards', 'clean', 'refactor', 'design'],
+            'testing': ['test', 'coverage', 'unit test', 'integration'],
+            'documentation': ['docs', 'documentation', 'comment', 'readme'],
+            'security': ['security', 'vulnerability', 'auth', 'permission'],
+            'performance': ['performance', 'slow', 'optimization', 'memory'],
+            'style': ['style', 'formatting', 'lint', 'convention'],
+            'unclear': ['unclear', 'confusing', 'understand', 'explain']
+        }
+        self.high_severity_words = ['critical', 'major', 'blocking', 'must', 'required', 'urgent']
+        self.medium_severity_words = ['should', 'important', 'needed', 'consider']
+        
+        # Keywords for assessing constructiveness
+        self.constructive_indicators = ['suggest', 'recommend', 'consider', 'try', 'how about', 'maybe', 'could']
+        self.destructive_indicators = ['bad', 'terrible', 'wrong', 'stupid', 'awful']
+        self.solution_indicators = ['here is', 'you can', 'try this', 'example', 'documentation']
+        self.reference_indicators = ['http', 'example']
+        self.feedback_keywords = ['suggest', 'recommend', 'consider', 'try', 'example']
+        
+        # Single-pass keyword scanners; toxicity and constructiveness share one
+        # fused alternation so each body is walked once for both scores
+        self._body_scanner = _KeywordScanner({
+            'negative': self.negative_keywords,
+            'personal_attack': self.personal_attack_phrases,
+            'softener': self.constructive_keywords,
+            'constructive': self.constructive_indicators,
+            'solution': self.solution_indicators,
+            'destructive': self.destructive_indicators,
+            'reference': self.reference_indicators
+        })
+        self._blocking_reason_scanner = _KeywordScanner(self.blocking_reason_keywords)
+        self._blocking_reasons = tuple(self.blocking_reason_keywords) + ('other',)
+        self._severity_scanner = _KeywordScanner({
+            'high': self.high_severity_words,
+            'medium': self.medium_severity_words
+        })
+        
+        # Only the presence of feedback keywords matters, so one alternation suffices
+        self._feedback_re = re.compile('|'.join(map(re.escape, self.feedback_keywords)))
+        
+        # Memoize body feature extraction per detector: a body is scored on
+        # several paths and boilerplate comments ("LGTM", "+1") repeat across MRs
+        self._body_features_cache: Dict[str, Tuple[int, ...]] = {}
+    
+    def index_comments(self, all_comments: List[ReviewComment]) -> CommentIndex:
+        """Group and unpack comments in a single pass.
+        
+        Args:
+            all_comments: List of all review comments
+            
+        Returns:
+            CommentIndex to pass to the team-wide analysis methods
+        """
+        n_comments = len(all_comments)
+        author_codes: Dict[str, int] = {}
+        groups: List[List[ReviewComment]] = []
+        mr_author_codes = np.empty(n_comments, dtype=np.intp)
+        sentiments = np.empty(n_comments, dtype=np.float64)
+        
+        # One string lookup per comment; everything after is keyed by author code
+        for i, comment in enumerate(all_comments):
+            author = comment.mr_author
+            code = author_codes.get(author)
+            if code is None:
+                code = author_codes[author] = len(groups)
+                groups.append([])
+            groups[code].append(comment)
+            mr_author_codes[i] = code
+            sentiments[i] = comment.sentiment.textblob_score
+        
+        return CommentIndex(
+            by_mr_author=dict(zip(author_codes, groups)),
+            mr_author_codes=mr_author_codes,
+            sentiments=sentiments
+        )
     
-    def analyze_developer_treatment(self, all_comments: List[ReviewComment]) -> Dict[str, DeveloperTreatment]:
+    def analyze_developer_treatment(self, all_comments: List[ReviewComment],
+                                    index: Optional[CommentIndex] = None,
+                                    max_workers: Optional[int] = None) -> Dict[str, DeveloperTreatment]:
         """Analyze how each developer is treated by different reviewers.
         
         Args:
             all_comments: List of all review comments
+            index: Prebuilt index of all_comments (built here when omitted)
+            max_workers: Number of worker processes to spread developers over;
+                chosen from the CPU count for large teams when omitted, and 1
+                analyzes developers in this process
             
         Returns:
             Dictionary mapping developer names to their treatment analysis
         """
-        developer_analysis = {}
-        
-        # Group comments by MR author (developer)
-        comments_by_developer = defaultdict(list)
-        for comment in all_comments:
-            comments_by_developer[comment.mr_author].append(comment)
-        
-        for developer, dev_comments in comments_by_developer.items():
-            analysis = self._analyze_individual_developer_treatment(developer, dev_comments)
-            developer_analysis[developer] = analysis
+        if index is None:
+            index = self.index_comments(all_comments)
+        
+        developers = list(index.by_mr_author)
+        developer_comments = list(index.by_mr_author.values())
+        
+        # Developers are independent and the keyword scanning is CPU-bound, so
+        # large teams can be split across processes
+        max_workers = resolve_max_workers(max_workers, len(developers))
+        if max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                analyses = list(executor.map(
+                    self._analyze_individual_developer_treatment, developers, developer_comments
+                ))
+        else:
+            analyses = map(self._analyze_individual_developer_treatment, developers, developer_comments)
         
-        return developer_analysis
+        return dict(zip(developers, analyses))
     
     def _analyze_individual_developer_treatment(self, developer: str, 
                                               comments: List[ReviewComment]) -> DeveloperTreatment:
@@ -78,80 +304,118 @@ class BiasDetector:
         Returns:
             DeveloperTreatment object with analysis results
         """
-        # Group by reviewer
-        reviewer_sentiments = defaultdict(list)
-        reviewer_actions = defaultdict(lambda: {'approved': 0, 'requested_changes': 0, 'commented': 0})
-        reviewer_toxicity = defaultdict(list)
-        reviewer_blocking_behavior = defaultdict(list)
-        
-        for comment in comments:
+        # Unpack the comments once into column arrays; reviewers get integer
+        # codes in order of first appearance
+        n_comments = len(comments)
+        scores = np.empty(n_comments, dtype=np.float64)
+        bodies_lower = [comment.body.lower() for comment in comments]
+        toxicity, constructiveness = self._score_bodies(bodies_lower)
+        reviewer_codes = np.empty(n_comments, dtype=np.intp)
+        status_codes = np.empty(n_comments, dtype=np.intp)
+        reviewer_index: Dict[str, int] = {}
+        reviewer_blocking_behavior: List[List[Dict]] = []
+        
+        for i, comment in enumerate(comments):
             reviewer = comment.author
-            reviewer_sentiments[reviewer].append(comment.sentiment.textblob_score)
-            reviewer_actions[reviewer][comment.approval_status.value] += 1
-            
-            # Calculate toxicity score for this comment
-            toxicity_score = self._calculate_toxicity_score(comment.body)
-            reviewer_toxicity[reviewer].append(toxicity_score)
+            code = reviewer_index.get(reviewer)
+            if code is None:
+                code = reviewer_index[reviewer] = len(reviewer_blocking_behavior)
+                reviewer_blocking_behavior.append([])
+            status_code = _STATUS_CODES[comment.approval_status.value]
+            reviewer_codes[i] = code
+            status_codes[i] = status_code
+            scores[i] = comment.sentiment.textblob_score
             
             # Track blocking behavior patterns
-            if comment.approval_status.value == 'requested_changes':
-                reviewer_blocking_behavior[reviewer].append({
-                    'reason': self._extract_blocking_reason(comment.body),
-                    'severity': self._assess_blocking_severity(comment.body),
-                    'constructiveness': self._assess_constructiveness(comment.body),
+            if status_code == _REQUESTED_CHANGES:
+                reviewer_blocking_behavior[code].append({
+                    'reason': self._extract_blocking_reason(bodies_lower[i]),
+                    'severity': self._assess_blocking_severity(bodies_lower[i]),
+                    'constructiveness': int(constructiveness[i]),
                     'comment': comment
                 })
         
-        # Calculate reviewer statistics
+        is_negative = scores < self.negative_sentiment_threshold
+        
+        # Per-reviewer columns; the grouped sums run in comment order, as the
+        # original sum() / len() averages did
+        n_reviewers = len(reviewer_index)
+        action_counts = np.zeros((n_reviewers, len(_APPROVAL_STATUSES)), dtype=np.int64)
+        np.add.at(action_counts, (reviewer_codes, status_codes), 1)
+        review_counts = action_counts.sum(axis=1)
+        blocking_counts = action_counts[:, _REQUESTED_CHANGES]
+        is_blocking = status_codes == _REQUESTED_CHANGES
+        
+        avg_sentiments = np.bincount(reviewer_codes, weights=scores, minlength=n_reviewers) / review_counts
+        avg_toxicities = np.bincount(reviewer_codes, weights=toxicity, minlength=n_reviewers) / review_counts
+        approval_rates = action_counts[:, _APPROVED] / review_counts
+        change_request_rates = blocking_counts / review_counts
+        with np.errstate(invalid='ignore'):
+            blocking_constructiveness = np.bincount(
+                reviewer_codes[is_blocking], weights=constructiveness[is_blocking], minlength=n_reviewers
+            ) / blocking_counts
+        
+        # Determine treatment levels with enhanced criteria
+        treatments = self._determine_treatment_levels(
+            avg_sentiments, avg_toxicities, change_request_rates, blocking_counts, blocking_constructiveness
+        )
+        
+        # Spread between the most and least supportive reviewers
+        sentiment_range = float(avg_sentiments.max() - avg_sentiments.min()) if n_reviewers else 0
+        
+        # Materialize the columns into per-reviewer statistics
+        avg_sentiments = avg_sentiments.tolist()
+        avg_toxicities = avg_toxicities.tolist()
+        review_counts = review_counts.tolist()
+        approval_rates = approval_rates.tolist()
+        change_request_rates = change_request_rates.tolist()
+        
         reviewer_stats = {}
-        for reviewer, sentiments in reviewer_sentiments.items():
-            avg_sentiment = sum(sentiments) / len(sentiments)
-            avg_toxicity = sum(reviewer_toxicity[reviewer]) / len(reviewer_toxicity[reviewer])
-            actions = reviewer_actions[reviewer]
-            total_reviews = sum(actions.values())
+        for reviewer, code in reviewer_index.items():
+            treatment_info = treatments[code]
             
             # Analyze blocking behavior
-            blocking_analysis = self._analyze_blocking_patterns(reviewer_blocking_behavior[reviewer])
-            
-            # Determine treatment level with enhanced criteria
-            treatment_info = self._determine_treatment_level(
-                avg_sentiment, avg_toxicity, actions, total_reviews, blocking_analysis
-            )
+            blocking_analysis = self._analyze_blocking_patterns(reviewer_blocking_behavior[code])
             
             # Identify negative patterns
-            negative_patterns = self._identify_negative_patterns(reviewer, comments)
+            in_group = reviewer_codes == code
+            reviewer_rows = np.flatnonzero(in_group)
+            negative_patterns = self._identify_negative_patterns(
+                [comments[i] for i in reviewer_rows],
+                [bodies_lower[i] for i in reviewer_rows],
+                status_codes[reviewer_rows] == _REQUESTED_CHANGES
+            )
             
             # Find negative comments for documentation
-            negative_comments = [
-                comment for comment in comments 
-                if comment.author == reviewer and comment.sentiment.textblob_score < self.negative_sentiment_threshold
-            ]
+            negative_rows = np.flatnonzero(in_group & is_negative)
+            negative_comments = [comments[i] for i in negative_rows]
+            negative_bodies_lower = [bodies_lower[i] for i in negative_rows]
+            documented_negative_behavior = self._document_negative_behavior(
+                negative_comments, negative_bodies_lower, scores[negative_rows],
+                toxicity[negative_rows], constructiveness[negative_rows]
+            )
             
             reviewer_stats[reviewer] = {
-                'avg_sentiment': avg_sentiment,
-                'avg_toxicity': avg_toxicity,
-                'review_count': len(sentiments),
+                'avg_sentiment': avg_sentiments[code],
+                'avg_toxicity': avg_toxicities[code],
+                'review_count': review_counts[code],
                 'treatment': treatment_info['level'],
                 'treatment_color': treatment_info['color'],
                 'treatment_icon': treatment_info['icon'],
-                'approval_rate': actions['approved'] / total_reviews if total_reviews > 0 else 0,
-                'change_request_rate': actions['requested_changes'] / total_reviews if total_reviews > 0 else 0,
+                'approval_rate': approval_rates[code],
+                'change_request_rate': change_request_rates[code],
                 'blocking_analysis': blocking_analysis,
                 'negative_patterns': negative_patterns,
-                'communication_style': self._determine_communication_style(sentiments, reviewer_toxicity[reviewer]),
-                'negative_comments': self._document_negative_behavior(negative_comments)
+                'communication_style': self._determine_communication_style(
+                    avg_sentiments[code], avg_toxicities[code]
+                ),
+                'negative_comments': documented_negative_behavior
             }
         
         # Overall analysis for the developer
-        all_sentiments = [comment.sentiment.textblob_score for comment in comments]
-        overall_sentiment = sum(all_sentiments) / len(all_sentiments) if all_sentiments else 0
+        overall_sentiment = float(scores.mean()) if n_comments else 0
         
-        # Find most and least supportive reviewers
         if reviewer_stats:
-            most_supportive = max(reviewer_stats.items(), key=lambda x: x[1]['avg_sentiment'])
-            least_supportive = min(reviewer_stats.items(), key=lambda x: x[1]['avg_sentiment'])
-            sentiment_range = most_supportive[1]['avg_sentiment'] - least_supportive[1]['avg_sentiment']
-            
             # Determine bias indicators
             bias_indicators = []
             if overall_sentiment < self.negative_sentiment_threshold:
@@ -181,7 +445,7 @@ class BiasDetector:
                 developer_name=developer,
                 overall_sentiment=overall_sentiment,
                 total_reviews=len(comments),
-                total_negative_reviews=sum(1 for c in comments if c.sentiment.textblob_score < self.negative_sentiment_threshold),
+                total_negative_reviews=int(is_negative.sum()),
                 sentiment_range=sentiment_range,
                 bias_indicators=bias_indicators,
                 bias_risk=bias_risk,
@@ -202,6 +466,65 @@ class BiasDetector:
             reviewer_stats={}
         )
     
+    def _body_features(self, text_lower: str) -> Tuple[int, ...]:
+        """Extract the keyword and pattern hit counts used to score a comment.
+        
+        Memoized per detector for up to _SCORE_CACHE_SIZE bodies; the oldest
+        entry is evicted when the cache is full.
+        
+        Args:
+            text_lower: Lowercased comment text
+            
+        Returns:
+            Tuple of hit counts, one per _BODY_FEATURES column
+        """
+        cache = self._body_features_cache
+        features = cache.get(text_lower)
+        if features is not None:
+            return features
+        
+        if len(cache) >= _SCORE_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        
+        hits = self._body_scanner.scan(text_lower)
+        features = cache[text_lower] = (
+            hits['negative'],
+            sum(1 for regex in self._toxic_regexes if regex.search(text_lower)),
+            hits['personal_attack'],
+            hits['softener'],
+            hits['constructive'],
+            hits['solution'],
+            hits['destructive'],
+            hits['reference']
+        )
+        return features
+    
+    def _score_bodies(self, bodies_lower: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Score a batch of comment bodies for toxicity and constructiveness.
+        
+        Args:
+            bodies_lower: Lowercased comment texts
+            
+        Returns:
+            Tuple of (toxicity scores between 0 and 1, constructiveness scores 0-100)
+        """
+        features = np.array([self._body_features(body_lower) for body_lower in bodies_lower], dtype=np.int64)
+        (negative, toxic_patterns, personal_attacks, softeners,
+         constructive, solutions, destructive, references) = features.reshape(-1, _BODY_FEATURES).T
+        
+        # Keyword and pattern hits raise toxicity, constructive language lowers it
+        toxicity = negative * 0.2
+        toxicity += toxic_patterns * 0.3
+        toxicity += personal_attacks * 0.25
+        toxicity -= softeners * 0.1
+        np.clip(toxicity, 0.0, 1.0, out=toxicity)
+        
+        # Base score of 50, plus a bonus for providing examples or links
+        constructiveness = 50 + 5 * constructive + 10 * solutions - 10 * destructive + 15 * (references > 0)
+        np.clip(constructiveness, 0, 100, out=constructiveness)
+        
+        return toxicity, constructiveness
+    
     def _calculate_toxicity_score(self, text: str) -> float:
         """Calculate toxicity score for a comment (0-1).
         
@@ -211,75 +534,37 @@ class BiasDetector:
         Returns:
             Toxicity score between 0 and 1
         """
-        text_lower = text.lower()
-        toxicity_score = 0.0
-        
-        # Check for negative keywords
-        negative_count = sum(1 for keyword in self.negative_keywords if keyword in text_lower)
-        toxicity_score += negative_count * 0.2
-        
-        # Check for toxic patterns
-        import re
-        pattern_matches = sum(1 for pattern in self.toxic_patterns if re.search(pattern, text_lower))
-        toxicity_score += pattern_matches * 0.3
-        
-        # Check for personal attacks
-        personal_attacks = ['you are', 'you\'re', 'your fault', 'you did', 'you made']
-        personal_attack_count = sum(1 for attack in personal_attacks if attack in text_lower)
-        toxicity_score += personal_attack_count * 0.25
-        
-        # Check for constructive language (reduces toxicity)
-        constructive_count = sum(1 for keyword in self.constructive_keywords if keyword in text_lower)
-        toxicity_score -= constructive_count * 0.1
-        
-        return max(0.0, min(1.0, toxicity_score))
+        toxicity, _ = self._score_bodies([text.lower()])
+        return float(toxicity[0])
     
-    def _extract_blocking_reason(self, comment_body: str) -> str:
+    def _extract_blocking_reason(self, body_lower: str) -> int:
         """Extract the main reason for blocking an MR.
         
         Args:
-            comment_body: Comment text
+            body_lower: Lowercased comment text
             
         Returns:
-            Category of blocking reason
+            Index of the blocking reason category in self._blocking_reasons
         """
-        reasons = {
-            'code_quality': ['quality', 'standards', 'clean', 'refactor', 'design'],
-            'testing': ['test', 'coverage', 'unit test', 'integration'],
-            'documentation': ['docs', 'documentation', 'comment', 'readme'],
-            'security': ['security', 'vulnerability', 'auth', 'permission'],
-            'performance': ['performance', 'slow', 'optimization', 'memory'],
-            'style': ['style', 'formatting', 'lint', 'convention'],
-            'unclear': ['unclear', 'confusing', 'understand', 'explain']
-        }
-        
-        comment_lower = comment_body.lower()
-        for reason, keywords in reasons.items():
-            if any(keyword in comment_lower for keyword in keywords):
-                return reason
-        
-        return 'other'
+        return self._blocking_reason_scanner.first_index(body_lower)
     
-    def _assess_blocking_severity(self, comment_body: str) -> str:
+    def _assess_blocking_severity(self, body_lower: str) -> int:
         """Assess the severity of a blocking comment.
         
         Args:
-            comment_body: Comment text
+            body_lower: Lowercased comment text
             
         Returns:
-            Severity level (high, medium, low)
+            Index of the severity level (low, medium, high) in _SEVERITY_LEVELS
         """
-        high_severity_words = ['critical', 'major', 'blocking', 'must', 'required', 'urgent']
-        medium_severity_words = ['should', 'important', 'needed', 'consider']
-        
-        comment_lower = comment_body.lower()
+        hits = self._severity_scanner.scan(body_lower)
         
-        if any(word in comment_lower for word in high_severity_words):
-            return 'high'
-        elif any(word in comment_lower for word in medium_severity_words):
-            return 'medium'
+        if hits['high']:
+            return _HIGH_SEVERITY
+        elif hits['medium']:
+            return _MEDIUM_SEVERITY
         else:
-            return 'low'
+            return _LOW_SEVERITY
     
     def _assess_constructiveness(self, text: str) -> int:
         """Assess constructiveness of a comment (0-100).
@@ -290,25 +575,8 @@ class BiasDetector:
         Returns:
             Constructiveness score (0-100)
         """
-        constructive_indicators = ['suggest', 'recommend', 'consider', 'try', 'how about', 'maybe', 'could']
-        destructive_indicators = ['bad', 'terrible', 'wrong', 'stupid', 'awful']
-        solution_indicators = ['here is', 'you can', 'try this', 'example', 'documentation']
-        
-        text_lower = text.lower()
-        score = 50  # Base score
-        
-        # Add points for constructive language
-        score += sum(5 for word in constructive_indicators if word in text_lower)
-        score += sum(10 for word in solution_indicators if word in text_lower)
-        
-        # Subtract points for destructive language
-        score -= sum(10 for word in destructive_indicators if word in text_lower)
-        
-        # Bonus for providing examples or links
-        if 'http' in text_lower or 'example' in text_lower:
-            score += 15
-        
-        return max(0, min(100, score))
+        _, constructiveness = self._score_bodies([text.lower()])
+        return int(constructiveness[0])
     
     def _analyze_blocking_patterns(self, blocking_behaviors: List[Dict]) -> Dict:
         """Analyze patterns in blocking behavior.
@@ -322,136 +590,126 @@ class BiasDetector:
         if not blocking_behaviors:
             return {'frequency': 0, 'patterns': [], 'severity_distribution': {}}
         
-        reasons = [b['reason'] for b in blocking_behaviors]
-        severities = [b['severity'] for b in blocking_behaviors]
-        constructiveness_scores = [b['constructiveness'] for b in blocking_behaviors]
+        # Reasons and severities arrive as integer codes, so both distributions
+        # are plain histograms
+        count = len(blocking_behaviors)
+        reason_ids = np.fromiter((b['reason'] for b in blocking_behaviors), dtype=np.intp, count=count)
+        severity_ids = np.fromiter((b['severity'] for b in blocking_behaviors), dtype=np.intp, count=count)
+        constructiveness_scores = np.fromiter((b['constructiveness'] for b in blocking_behaviors),
+                                              dtype=np.float64, count=count)
+        
+        reason_dist = np.bincount(reason_ids, minlength=len(self._blocking_reasons))
+        severity_dist = np.bincount(severity_ids, minlength=len(_SEVERITY_LEVELS))
         
         patterns = []
-        if len(set(reasons)) == 1 and len(reasons) > 2:
-            patterns.append(f"Consistently blocks for {reasons[0]} issues")
+        if np.count_nonzero(reason_dist) == 1 and count > 2:
+            patterns.append(f"Consistently blocks for {self._blocking_reasons[reason_ids[0]]} issues")
         
-        if len([s for s in severities if s == 'high']) > len(severities) * 0.6:
+        if severity_dist[_HIGH_SEVERITY] > count * 0.6:
             patterns.append("Tends to escalate issues to high severity")
         
-        avg_constructiveness = sum(constructiveness_scores) / len(constructiveness_scores)
+        avg_constructiveness = float(constructiveness_scores.mean())
         if avg_constructiveness < 40:
             patterns.append("Blocking comments lack constructive feedback")
         
         return {
-            'frequency': len(blocking_behaviors),
+            'frequency': count,
             'patterns': patterns,
-            'severity_distribution': dict(Counter(severities)),
+            'severity_distribution': {
+                _SEVERITY_LEVELS[code]: int(n) for code, n in enumerate(severity_dist) if n
+            },
             'avg_constructiveness': avg_constructiveness,
-            'common_reasons': dict(Counter(reasons))
+            'common_reasons': {
+                self._blocking_reasons[code]: int(n) for code, n in enumerate(reason_dist) if n
+            }
         }
     
-    def _determine_treatment_level(self, avg_sentiment: float, avg_toxicity: float, 
-                                 actions: Dict, total_reviews: int, 
-                                 blocking_analysis: Dict) -> Dict:
-        """Determine treatment level with enhanced criteria.
+    def _determine_treatment_levels(self, avg_sentiments: np.ndarray, avg_toxicities: np.ndarray,
+                                    change_request_rates: np.ndarray, blocking_counts: np.ndarray,
+                                    blocking_constructiveness: np.ndarray) -> List[Dict]:
+        """Determine treatment levels for a set of reviewers with enhanced criteria.
         
         Args:
-            avg_sentiment: Average sentiment score
-            avg_toxicity: Average toxicity score
-            actions: Dictionary of approval actions
-            total_reviews: Total number of reviews
-            blocking_analysis: Blocking behavior analysis
+            avg_sentiments: Average sentiment score per reviewer
+            avg_toxicities: Average toxicity score per reviewer
+            change_request_rates: Share of each reviewer's reviews requesting changes
+            blocking_counts: Number of change requests per reviewer
+            blocking_constructiveness: Average constructiveness of each reviewer's change requests
             
         Returns:
-            Dictionary with treatment level information
+            List of treatment level dictionaries, one per reviewer
         """
-        # Calculate composite score
-        sentiment_score = avg_sentiment
-        toxicity_penalty = -avg_toxicity * 0.5
-        blocking_penalty = 0
-        
-        if blocking_analysis['frequency'] > 0:
-            change_request_rate = actions['requested_changes'] / total_reviews if total_reviews > 0 else 0
-            if change_request_rate > 0.7:
-                blocking_penalty -= 0.3
-            elif blocking_analysis['avg_constructiveness'] < 40:
-                blocking_penalty -= 0.2
-        
-        composite_score = sentiment_score + toxicity_penalty + blocking_penalty
-        
-        # Determine treatment level
-        if composite_score >= 0.3:
-            return {'level': 'Very Supportive', 'color': '#27ae60', 'icon': '🤗'}
-        elif composite_score >= 0.1:
-            return {'level': 'Supportive', 'color': '#2ecc71', 'icon': '😊'}
-        elif composite_score >= -0.1:
-            return {'level': 'Neutral', 'color': '#95a5a6', 'icon': '😐'}
-        elif composite_score >= -0.3:
-            return {'level': 'Critical', 'color': '#f39c12', 'icon': '🤨'}
-        elif composite_score >= -0.5:
-            return {'level': 'Very Critical', 'color': '#e67e22', 'icon': '😠'}
-        else:
-            return {'level': 'Potentially Toxic', 'color': '#e74c3c', 'icon': '🚨'}
+        # Calculate composite scores
+        toxicity_penalties = -avg_toxicities * 0.5
+        blocking_penalties = np.where(
+            blocking_counts == 0, 0.0,
+            np.where(change_request_rates > 0.7, -0.3,
+                     np.where(blocking_constructiveness < 40, -0.2, 0.0))
+        )
+        composite_scores = avg_sentiments + toxicity_penalties + blocking_penalties
+        
+        # Determine treatment levels
+        level_codes = np.searchsorted(_TREATMENT_THRESHOLDS, composite_scores, side='right')
+        return [_TREATMENT_LEVELS[code] for code in level_codes]
     
-    def _identify_negative_patterns(self, reviewer: str, comments: List[ReviewComment]) -> List[str]:
+    def _identify_negative_patterns(self, reviewer_comments: List[ReviewComment],
+                                    bodies_lower: List[str], is_change_request: np.ndarray) -> List[str]:
         """Identify specific negative patterns in reviewer behavior.
         
         Args:
-            reviewer: Reviewer name
-            comments: List of comments
+            reviewer_comments: List of the reviewer's comments
+            bodies_lower: Lowercased comment texts, aligned with reviewer_comments
+            is_change_request: Whether each comment requested changes
             
         Returns:
             List of identified negative patterns
         """
         patterns = []
-        reviewer_comments = [c for c in comments if c.author == reviewer]
+        n_reviewer_comments = len(reviewer_comments)
         
-        if not reviewer_comments:
+        if not n_reviewer_comments:
             return patterns
         
         # Check for excessive commenting
-        comment_counts_per_mr = defaultdict(int)
-        for comment in reviewer_comments:
-            comment_counts_per_mr[comment.mr_title] += 1
-        
-        excessive_mrs = [count for count in comment_counts_per_mr.values() 
-                        if count > self.excessive_comment_threshold]
-        if len(excessive_mrs) > len(comment_counts_per_mr) * 0.3:
+        comment_counts_per_mr = Counter(comment.mr_title for comment in reviewer_comments)
+        excessive_threshold = self.excessive_comment_threshold
+        n_excessive_mrs = sum(1 for count in comment_counts_per_mr.values() if count > excessive_threshold)
+        if n_excessive_mrs > len(comment_counts_per_mr) * 0.3:
             patterns.append("Tends to over-comment on merge requests")
         
         # Check for consistently negative sentiment
-        sentiments = [c.sentiment.textblob_score for c in reviewer_comments]
-        avg_sentiment = sum(sentiments) / len(sentiments)
+        avg_sentiment = sum(c.sentiment.textblob_score for c in reviewer_comments) / n_reviewer_comments
         if avg_sentiment < -0.3:
             patterns.append("Consistently negative sentiment in reviews")
         
         # Check for nitpicking behavior
-        short_critical_comments = [
-            comment for comment in reviewer_comments 
+        n_short_critical = sum(
+            1 for comment in reviewer_comments
             if len(comment.body) < 50 and comment.sentiment.textblob_score < -0.2
-        ]
-        if len(short_critical_comments) > len(reviewer_comments) * 0.4:
+        )
+        if n_short_critical > n_reviewer_comments * 0.4:
             patterns.append("Shows nitpicking behavior with short critical comments")
         
         # Check for blocking without constructive feedback
-        change_requests = [c for c in reviewer_comments if c.approval_status.value == 'requested_changes']
+        change_requests = [bodies_lower[i] for i in np.flatnonzero(is_change_request)]
         if change_requests:
-            constructive_keywords = ['suggest', 'recommend', 'consider', 'try', 'example']
-            non_constructive = [c for c in change_requests 
-                              if not any(keyword in c.body.lower() for keyword in constructive_keywords)]
-            if len(non_constructive) > len(change_requests) * 0.5:
+            feedback_search = self._feedback_re.search
+            n_non_constructive = sum(1 for body_lower in change_requests if not feedback_search(body_lower))
+            if n_non_constructive > len(change_requests) * 0.5:
                 patterns.append("Blocks MRs without providing constructive feedback")
         
         return patterns
     
-    def _determine_communication_style(self, sentiments: List[float], toxicity_scores: List[float]) -> str:
+    def _determine_communication_style(self, avg_sentiment: float, avg_toxicity: float) -> str:
         """Determine overall communication style based on sentiment and toxicity.
         
         Args:
-            sentiments: List of sentiment scores
-            toxicity_scores: List of toxicity scores
+            avg_sentiment: Average sentiment score
+            avg_toxicity: Average toxicity score
             
         Returns:
             Communication style description
         """
-        avg_sentiment = sum(sentiments) / len(sentiments) if sentiments else 0
-        avg_toxicity = sum(toxicity_scores) / len(toxicity_scores) if toxicity_scores else 0
-        
         if avg_sentiment > 0.2 and avg_toxicity < 0.2:
             return "Encouraging & Constructive"
         elif avg_sentiment > 0.0 and avg_toxicity < 0.3:
@@ -463,42 +721,52 @@ class BiasDetector:
         else:
             return "Harsh & Potentially Problematic"
     
-    def _document_negative_behavior(self, comments: List[ReviewComment]) -> List[Dict]:
+    def _document_negative_behavior(self, comments: List[ReviewComment], bodies_lower: List[str],
+                                    sentiments: np.ndarray, toxicity: np.ndarray,
+                                    constructiveness: np.ndarray) -> List[Dict]:
         """Document instances of negative behavior with context.
         
+        The scores are the ones already computed for the developer's comments,
+        so the bodies are not scored a second time.
+        
         Args:
             comments: List of negative comments
+            bodies_lower: Lowercased comment texts, aligned with comments
+            sentiments: Sentiment scores, aligned with comments
+            toxicity: Toxicity scores, aligned with comments
+            constructiveness: Constructiveness scores, aligned with comments
             
         Returns:
             List of documented negative behavior instances
         """
-        documented_instances = []
+        n_comments = len(comments)
+        lengths = np.fromiter((len(c.body) for c in comments), dtype=np.intp, count=n_comments)
+        mentions_you = np.fromiter(("you" in body_lower for body_lower in bodies_lower), dtype=bool, count=n_comments)
+        
+        # Categorize the negative behavior, one flag column per category
+        very_negative = sentiments < -0.3
+        category_flags = np.column_stack((
+            toxicity > 0.5,
+            mentions_you & very_negative,
+            constructiveness < 30,
+            (lengths < 50) & very_negative
+        )).tolist()
+        severity_codes = (toxicity > 0.4).astype(np.intp) + (toxicity > 0.7)
         
-        for comment in comments:
-            toxicity_score = self._calculate_toxicity_score(comment.body)
-            constructiveness_score = self._assess_constructiveness(comment.body)
-            
-            # Categorize the negative behavior
-            categories = []
-            if toxicity_score > 0.5:
-                categories.append("Toxic language")
-            if "you" in comment.body.lower() and comment.sentiment.textblob_score < -0.3:
-                categories.append("Personal criticism")
-            if constructiveness_score < 30:
-                categories.append("Non-constructive feedback")
-            if len(comment.body) < 50 and comment.sentiment.textblob_score < -0.3:
-                categories.append("Dismissive comment")
-            
+        documented_instances = []
+        for comment, flags, toxicity_score, constructiveness_score, severity_code in zip(
+                comments, category_flags, toxicity.tolist(), constructiveness.tolist(), severity_codes.tolist()):
             # Default category if none detected
-            if not categories:
-                categories.append("Negative sentiment")
+            categories = [
+                category for category, flag in zip(_NEGATIVE_BEHAVIOR_CATEGORIES, flags) if flag
+            ] or ["Negative sentiment"]
             
             documented_instances.append({
                 'comment': comment,
                 'toxicity_score': toxicity_score,
                 'constructiveness_score': constructiveness_score,
                 'categories': categories,
-                'severity': 'high' if toxicity_score > 0.7 else 'medium' if toxicity_score > 0.4 else 'low',
+                'severity': _SEVERITY_LEVELS[severity_code],
                 'context': {
                     'mr_title': comment.mr_title,
                     'created_at': comment.created_at.isoformat(),
@@ -506,8 +774,10 @@ class BiasDetector:
                 }
             })
         
-        # Sort by toxicity score (most toxic first)
-        return sorted(documented_instances, key=lambda x: x['toxicity_score'], reverse=True)
+        # Sort by toxicity score (most toxic first); a stable sort on the negated
+        # scores keeps ties in comment order, as sorted(..., reverse=True) did
+        order = np.argsort(-toxicity, kind='stable')
+        return [documented_instances[i] for i in order]
     
     def _generate_developer_recommendations(self, bias_indicators: List[str], 
                                           reviewer_stats: Dict) -> List[str]:
@@ -549,35 +819,42 @@ class BiasDetector:
         
         return recommendations
     
-    def calculate_bias_indicators(self, all_comments: List[ReviewComment]) -> BiasAnalysis:
+    def calculate_bias_indicators(self, all_comments: List[ReviewComment],
+                                  index: Optional[CommentIndex] = None) -> BiasAnalysis:
         """Calculate comprehensive bias indicators across the team.
         
         Args:
             all_comments: List of all review comments
+            index: Prebuilt index of all_comments (built here when omitted)
             
         Returns:
             BiasAnalysis object with detailed bias analysis
         """
-        author_sentiments = defaultdict(list)
-        author_approval_rates = defaultdict(lambda: {'approved': 0, 'requested_changes': 0, 'commented': 0})
-        
-        # Group by MR author (who is being reviewed)
-        for comment in all_comments:
-            mr_author = comment.mr_author
-            author_sentiments[mr_author].append(comment.sentiment.textblob_score)
-            author_approval_rates[mr_author][comment.approval_status.value] += 1
+        if index is None:
+            index = self.index_comments(all_comments)
+        
+        # Calculate sentiment variance for each MR author (who is being reviewed)
+        codes = index.mr_author_codes
+        sample_sizes = np.bincount(codes, minlength=len(index.by_mr_author))
+        # Accumulate sums in extended precision so that, once rounded back to
+        # float64, the means match statistics.fmean and exact thresholds such
+        # as -0.3 compare the same way they did with statistics.mean
+        sums = np.zeros(sample_sizes.size, dtype=np.longdouble)
+        np.add.at(sums, codes, index.sentiments)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums.astype(np.float64) / sample_sizes
+            deviations = index.sentiments - means[codes]
+            stds = np.sqrt(np.bincount(codes, weights=deviations * deviations,
+                                       minlength=sample_sizes.size) / (sample_sizes - 1))
+        has_minimum_data = sample_sizes >= 3  # Minimum data requirement
         
-        # Calculate sentiment variance for each author
         sentiment_variance = {}
-        for author, sentiments in author_sentiments.items():
-            if len(sentiments) >= 3:  # Minimum data requirement
-                author_mean = statistics.mean(sentiments)
-                author_std = statistics.stdev(sentiments) if len(sentiments) > 1 else 0
-                
+        for code, author in enumerate(index.by_mr_author):
+            if has_minimum_data[code]:
                 sentiment_variance[author] = {
-                    'mean': author_mean,
-                    'std_dev': author_std,
-                    'sample_size': len(sentiments)
+                    'mean': float(means[code]),
+                    'std_dev': float(stds[code]),
+                    'sample_size': int(sample_sizes[code])
                 }
         
         # Identify potential bias targets
@@ -592,16 +869,12 @@ class BiasDetector:
         
         # Calculate overall bias score
         overall_bias_score = 0.0
-        if len(author_sentiments) > 1:
-            author_means = [
-                statistics.mean(sentiments) 
-                for sentiments in author_sentiments.values() 
-                if len(sentiments) >= 3
-            ]
+        if len(index.by_mr_author) > 1:
+            author_means = means[has_minimum_data]
             
-            if len(author_means) > 1:
+            if author_means.size > 1:
                 # High variance in mean sentiments across authors indicates potential bias
-                sentiment_variance_value = statistics.stdev(author_means)
+                sentiment_variance_value = float(author_means.std(ddof=1))
                 overall_bias_score = min(100, sentiment_variance_value * 100)
         
         # Determine overall risk level
@@ -33,7 +33,7 @@ class BiasRiskLevel(Enum):
     HIGH = "high"
 
 
-@dataclass
+@dataclass(slots=True)
 class SentimentScore:
     """Represents sentiment analysis scores from multiple algorithms."""
     textblob_score: float
@@ -58,7 +58,7 @@ class SentimentScore:
         return not self.is_negative and not self.is_positive
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewComment:
     """Represents a single review comment with enhanced analysis."""
     # Core properties
@@ -92,7 +92,7 @@ class ReviewComment:
             self.word_count = len(self.body.split())
 
 
-@dataclass
+@dataclass(slots=True)
 class BehaviorPattern:
     """Represents a detected behavior pattern in reviews."""
     pattern_type: str
@@ -109,7 +109,7 @@ class BehaviorPattern:
             self.severity = SeverityLevel(self.severity)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewerStats:
     """Statistics and metrics for a specific reviewer."""
     reviewer_name: str
@@ -140,7 +140,7 @@ class ReviewerStats:
         return self.requested_changes_count / max(self.total_reviews, 1)
 
 
-@dataclass
+@dataclass(slots=True)
 class DeveloperTreatment:
     """Analysis of how a developer is treated by reviewers."""
     developer_name: str
@@ -159,7 +159,7 @@ class DeveloperTreatment:
             self.bias_risk = BiasRiskLevel(self.bias_risk)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectMetrics:
     """Overall project metrics and statistics."""
     total_mrs: int
@@ -176,7 +176,7 @@ class ProjectMetrics:
     review_distribution: Dict[str, float] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class BiasAnalysis:
     """Comprehensive bias analysis results."""
     overall_risk: BiasRiskLevel
@@ -191,7 +191,7 @@ class BiasAnalysis:
             self.overall_risk = BiasRiskLevel(self.overall_risk)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Complete analysis result containing all components."""
     reviewer_stats: Optional[ReviewerStats] = None
@@ -6,20 +6,53 @@ including sentiment analysis and reviewer behavior patterns.
 """
 
 import os
+import asyncio
+import heapq
 import json
+import shelve
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from dataclasses import dataclass, asdict
-from collections import defaultdict
+from collections import defaultdict, deque
 
 import gitlab
+import numpy as np
 import pandas as pd
-from textblob import TextBlob
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 import ollama
 
+from note_classifier import classify_note_body, intern_name
+from sentiment_analyzer import _get_vader, _textblob_polarity, _vader_score_items, in_event_loop
 
-@dataclass
+
+# Scores both analyzers produce for empty or whitespace-only text
+_BLANK_VADER_SCORES = (('neg', 0.0), ('neu', 0.0), ('pos', 0.0), ('compound', 0.0))
+
+# Concurrent note fetches; kept within the HTTP session's default pool size
+_FETCH_WORKERS = 8
+
+# Merge requests per listing page, and note fetches kept in flight ahead of
+# the MR being scored while the listing is streamed
+_MR_PAGE_SIZE = 100
+_FETCH_AHEAD = 4 * _FETCH_WORKERS
+
+# Generation cap per LLM analysis; the prompt asks for 2-3 sentences
+_LLM_MAX_TOKENS = 200
+
+# Analysis recorded for a comment whose LLM generation failed
+_LLM_UNAVAILABLE = 'LLM analysis unavailable'
+
+# Bumped whenever the cached review row layout or scoring changes
+_REVIEW_CACHE_VERSION = 1
+
+# VADER score keys averaged in reviewer statistics, and approval statuses
+_VADER_KEYS = ['compound', 'pos', 'neu', 'neg']
+_APPROVAL_STATUSES = ['approved', 'requested_changes', 'commented']
+_STATUS_CODES = {status: code for code, status in enumerate(_APPROVAL_STATUSES)}
+
+
+@dataclass(slots=True)
 class ReviewComment:
     """Data class for storing review comment information."""
     author: str
@@ -33,7 +66,7 @@ class ReviewComment:
     approval_status: str  # 'approved', 'requested_changes', 'commented'
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewerStats:
     """Data class for storing reviewer statistics."""
     reviewer_name: str
@@ -47,34 +80,128 @@ class ReviewerStats:
     sentiment_by_author: Dict[str, List[float]]
 
 
+@dataclass
+class CommentTable:
+    """Columnar view of review comments used by the aggregation passes.
+    
+    Reviewer and MR author names are coded separately, each in order of first
+    appearance, so ascending codes follow comment order.
+    """
+    reviewers: List[str]
+    mr_authors: List[str]
+    reviewer_ids: np.ndarray  # codes into reviewers
+    mr_author_ids: np.ndarray  # codes into mr_authors
+    approval_status: np.ndarray  # codes into _APPROVAL_STATUSES
+    # Sentiments stay float64: per-comment scores are returned verbatim in
+    # sentiment_by_author and the reviewer-to-author matrix
+    sentiment_textblob: np.ndarray
+    sentiment_vader: np.ndarray  # one column per _VADER_KEYS entry
+    
+    @classmethod
+    def from_comments(cls, comments: List[ReviewComment]) -> 'CommentTable':
+        """Build the table from review comments.
+        
+        Args:
+            comments: List of review comments
+            
+        Returns:
+            CommentTable with one row per comment
+        """
+        n = len(comments)
+        reviewer_codes = {}
+        mr_author_codes = {}
+        reviewer_ids = np.empty(n, dtype=np.int32)
+        mr_author_ids = np.empty(n, dtype=np.int32)
+        approval_status = np.empty(n, dtype=np.int8)
+        sentiment_textblob = np.empty(n, dtype=np.float64)
+        sentiment_vader = np.empty((n, len(_VADER_KEYS)), dtype=np.float64)
+        
+        for i, comment in enumerate(comments):
+            reviewer_ids[i] = reviewer_codes.setdefault(comment.author, len(reviewer_codes))
+            mr_author_ids[i] = mr_author_codes.setdefault(comment.mr_author, len(mr_author_codes))
+            approval_status[i] = _STATUS_CODES[comment.approval_status]
+            sentiment_textblob[i] = comment.sentiment_textblob
+            sentiment_vader[i] = [comment.sentiment_vader.get(key, 0) for key in _VADER_KEYS]
+        
+        return cls(
+            reviewers=list(reviewer_codes),
+            mr_authors=list(mr_author_codes),
+            reviewer_ids=reviewer_ids,
+            mr_author_ids=mr_author_ids,
+            approval_status=approval_status,
+            sentiment_textblob=sentiment_textblob,
+            sentiment_vader=sentiment_vader
+        )
+    
+    def __len__(self) -> int:
+        return len(self.reviewer_ids)
+    
+    def group_pairs(self) -> Tuple[np.ndarray, List[Tuple[int, int, np.ndarray]]]:
+        """Group rows by (reviewer, MR author) pair.
+        
+        Returns:
+            Tuple of the pair index of every row and, per pair, its reviewer
+            code, MR author code and row indices. Pairs are numbered in order
+            of first appearance and row indices follow comment order
+        """
+        combined = self.reviewer_ids.astype(np.int64) * len(self.mr_authors) + self.mr_author_ids
+        _, first_rows, inverse = np.unique(combined, return_index=True, return_inverse=True)
+        appearance = np.argsort(first_rows)
+        rank = np.empty_like(appearance)
+        rank[appearance] = np.arange(len(appearance))
+        pair_index = rank[inverse.ravel()]
+        
+        order = np.argsort(pair_index, kind='stable')
+        rows_by_pair = np.split(order, np.cumsum(np.bincount(pair_index))[:-1])
+        groups = [
+            (int(self.reviewer_ids[first]), int(self.mr_author_ids[first]), rows)
+            for first, rows in zip(first_rows[appearance], rows_by_pair)
+        ]
+        return pair_index, groups
+
+
 class GitLabAnalyzer:
     """Main class for analyzing GitLab merge request reviews."""
     
-    def __init__(self, gitlab_url: str, private_token: str, project_id: str):
+    def __init__(self, gitlab_url: str, private_token: str, project_id: str,
+                 cache_path: Optional[str] = None):
         """Initialize the GitLab analyzer.
         
         Args:
             gitlab_url: GitLab instance URL
             private_token: GitLab private access token
             project_id: GitLab project ID
+            cache_path: Path of a shelve file caching scored review comments
+                per MR across runs; caching is disabled when omitted
         """
-        self.gl = gitlab.Gitlab(gitlab_url, private_token=private_token)
-        self.project = self.gl.projects.get(project_id)
-        self.vader_analyzer = SentimentIntensityAnalyzer()
-        
-    def get_merge_requests(self, since_date: datetime) -> List:
+        self.project_id = project_id
+        self.cache_path = cache_path
+        # Notes are fetched concurrently, so back off and retry on rate limiting
+        self.gl = gitlab.Gitlab(gitlab_url, private_token=private_token, retry_transient_errors=True)
+        self.vader_analyzer = _get_vader()
+        
+    @functools.cached_property
+    def project(self):
+        """GitLab project, fetched on first use."""
+        return self.gl.projects.get(self.project_id)
+    
+    def get_merge_requests(self, since_date: datetime) -> Iterator:
         """Get merge requests since a specific date.
         
+        Pages are requested lazily as the iterator is consumed, so analysis can
+        start after the first page instead of after the whole listing.
+        
         Args:
             since_date: Date from which to fetch MRs
             
         Returns:
-            List of merge request objects
+            Iterator over merge request objects
         """
         mrs = self.project.mergerequests.list(
             state='all',
             created_after=since_date.isoformat(),
-            all=True
+            iterator=True,
+            per_page=_MR_PAGE_SIZE
         )
         return mrs
     
@@ -87,14 +214,44 @@ class GitLabAnalyzer:
         Returns:
             Tuple of (TextBlob polarity, VADER scores)
         """
-        # TextBlob sentiment
-        blob = TextBlob(text)
-        textblob_sentiment = blob.sentiment.polarity
+        textblob_sentiment, vader_items = self._score_text(text)
+        return textblob_sentiment, dict(vader_items)
+    
+    def analyze_sentiments_batch(self, texts: List[str]) -> Tuple[List[float], List[Dict[str, float]]]:
+        """Analyze sentiment of several texts in one pass.
+        
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            Tuple of (TextBlob polarities, VADER scores), aligned with texts
+        """
+        scores = [self._score_text(text) for text in texts]
+        
+        textblob_sentiments = [textblob_sentiment for textblob_sentiment, _ in scores]
+        vader_scores = [dict(vader_items) for _, vader_items in scores]
+        
+        return textblob_sentiments, vader_scores
+    
+    def _score_text(self, text: str) -> Tuple[float, Tuple[Tuple[str, float], ...]]:
+        """Score a text with TextBlob and VADER.
+        
+        Both scores come from the per-text caches shared with
+        sentiment_analyzer, so the VADER scores are returned as an items
+        tuple; callers build a fresh dict from it.
         
-        # VADER sentiment
-        vader_scores = self.vader_analyzer.polarity_scores(text)
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            Tuple of (TextBlob polarity, VADER score items)
+        """
+        if not text.strip():
+            return 0.0, _BLANK_VADER_SCORES
         
-        return textblob_sentiment, vader_scores
+        # TextBlob sentiment, and VADER sentiment guarded against emoji-heavy
+        # and very long text
+        return _textblob_polarity(text), _vader_score_items(text)
     
     def get_mr_reviews(self, mr) -> List[ReviewComment]:
         """Get all review comments for a merge request.
@@ -105,28 +262,136 @@ class GitLabAnalyzer:
         Returns:
             List of ReviewComment objects
         """
-        comments = []
+        if self.cache_path is None:
+            return self._build_review_comments(mr, mr.notes.list(all=True))
+        
+        with shelve.open(self.cache_path) as cache:
+            comments = self._load_cached_reviews(cache, mr)
+            if comments is None:
+                comments = self._build_review_comments(mr, mr.notes.list(all=True))
+                self._store_cached_reviews(cache, mr, comments)
+        return comments
+    
+    def _fetch_reviews(self, mrs: Iterable) -> Iterator[List[ReviewComment]]:
+        """Get the review comments of several merge requests.
         
-        # Get notes (comments)
-        notes = mr.notes.list(all=True)
+        MRs found in the review cache are not fetched again. Only the HTTP
+        requests for the others run on worker threads; results are yielded in
+        MR order so sentiment scoring and cache access stay on the calling
+        thread.
         
-        for note in notes:
-            if note.system:  # Skip system notes
-                continue
+        Args:
+            mrs: Merge request objects
+            
+        Yields:
+            List of ReviewComment objects per merge request
+        """
+        cache = shelve.open(self.cache_path) if self.cache_path is not None else None
+        try:
+            with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as executor:
+                pending = deque()
+                for mr in mrs:
+                    comments = self._load_cached_reviews(cache, mr) if cache is not None else None
+                    notes = executor.submit(mr.notes.list, all=True) if comments is None else None
+                    pending.append((mr, comments, notes))
+                    if len(pending) > _FETCH_AHEAD:
+                        yield self._complete_reviews(cache, *pending.popleft())
                 
-            # Analyze sentiment
-            textblob_sentiment, vader_sentiment = self.analyze_sentiment(note.body)
+                while pending:
+                    yield self._complete_reviews(cache, *pending.popleft())
+        finally:
+            if cache is not None:
+                cache.close()
+    
+    def _complete_reviews(self, cache, mr, comments: Optional[List[ReviewComment]],
+                          notes: Optional[Future]) -> List[ReviewComment]:
+        """Build the review comments of a fetched MR, or return its cached ones."""
+        if comments is None:
+            comments = self._build_review_comments(mr, notes.result())
+            if cache is not None:
+                self._store_cached_reviews(cache, mr, comments)
+        return comments
+    
+    def _review_cache_key(self, mr) -> str:
+        """Cache key of a merge request; updated_at changes with every new note."""
+        return f"{_REVIEW_CACHE_VERSION}:{self.project_id}:{mr.id}:{mr.updated_at}"
+    
+    def _load_cached_reviews(self, cache, mr) -> Optional[List[ReviewComment]]:
+        """Look up a merge request's review comments in the cache.
+        
+        Args:
+            cache: Open shelve of cached reviews
+            mr: Merge request object
+            
+        Returns:
+            List of ReviewComment objects, or None on a cache miss
+        """
+        rows = cache.get(self._review_cache_key(mr))
+        if rows is None:
+            return None
+        comments = []
+        for author, body, created_at, mr_id, mr_title, mr_author, textblob, vader_items, status in rows:
+            comments.append(ReviewComment(
+                author=intern_name(author),
+                body=body,
+                created_at=created_at,
+                mr_id=mr_id,
+                mr_title=mr_title,
+                mr_author=intern_name(mr_author),
+                sentiment_textblob=textblob,
+                sentiment_vader=dict(vader_items),
+                approval_status=status
+            ))
+        return comments
+    
+    def _store_cached_reviews(self, cache, mr, comments: List[ReviewComment]):
+        """Store a merge request's review comments in the cache.
+        
+        Comments are stored as tuples of primitive fields to keep entries small.
+        
+        Args:
+            cache: Open shelve of cached reviews
+            mr: Merge request object
+            comments: Review comments built for the merge request
+        """
+        cache[self._review_cache_key(mr)] = [
+            (c.author, c.body, c.created_at, c.mr_id, c.mr_title, c.mr_author,
+             c.sentiment_textblob, tuple(c.sentiment_vader.items()), c.approval_status)
+            for c in comments
+        ]
+    
+    def _build_review_comments(self, mr, notes: List) -> List[ReviewComment]:
+        """Build review comments from a merge request's notes.
+        
+        Args:
+            mr: Merge request object
+            notes: Notes fetched for the merge request
             
+        Returns:
+            List of ReviewComment objects
+        """
+        comments = []
+        
+        # Skip system notes
+        notes = [note for note in notes if not note.system]
+        mr_author = intern_name(mr.author.get('name', 'Unknown'))
+        
+        # Analyze sentiment for all of the MR's notes at once
+        textblob_sentiments, vader_sentiments = self.analyze_sentiments_batch(
+            [note.body for note in notes]
+        )
+        
+        for note, textblob_sentiment, vader_sentiment in zip(notes, textblob_sentiments, vader_sentiments):
             # Determine approval status based on note content and system events
             approval_status = self._determine_approval_status(note, mr)
             
             comment = ReviewComment(
-                author=note.author.get('name', 'Unknown'),
+                author=intern_name(note.author.get('name', 'Unknown')),
                 body=note.body,
-                created_at=datetime.fromisoformat(note.created_at.replace('Z', '+00:00')),
+                created_at=datetime.fromisoformat(note.created_at),
                 mr_id=mr.id,
                 mr_title=mr.title,
-                mr_author=mr.author.get('name', 'Unknown'),
+                mr_author=mr_author,
                 sentiment_textblob=textblob_sentiment,
                 sentiment_vader=vader_sentiment,
                 approval_status=approval_status
@@ -146,27 +411,7 @@ class GitLabAnalyzer:
             String indicating approval status
         """
         # Check if this note contains approval/request changes indicators
-        body_lower = note.body.lower()
-        
-        # Look for approval indicators
-        approval_keywords = [
-            'approved', 'lgtm', 'looks good', 'approve', 'ship it',
-            ':+1:', '👍', ':thumbsup:', 'ready to merge'
-        ]
-        
-        # Look for request changes indicators
-        changes_keywords = [
-            'request changes', 'needs changes', 'please fix', 'fix this',
-            'don\'t merge', 'not ready', 'block', 'blocking', 'nack',
-            ':-1:', '👎', ':thumbsdown:'
-        ]
-        
-        if any(keyword in body_lower for keyword in approval_keywords):
-            return 'approved'
-        elif any(keyword in body_lower for keyword in changes_keywords):
-            return 'requested_changes'
-        else:
-            return 'commented'
+        return classify_note_body(note.body)
     
     def analyze_reviewer_patterns(self, reviewer_name: str, months: int = 6) -> Dict:
         """Analyze patterns for a specific reviewer over the last N months.
@@ -184,10 +429,12 @@ class GitLabAnalyzer:
         reviewer_comments = []
         all_comments = []
         
-        print(f"Analyzing {len(mrs)} merge requests...")
+        print(f"Analyzing merge requests since {since_date:%Y-%m-%d}...")
         
-        for mr in mrs:
-            comments = self.get_mr_reviews(mr)
+        # The listing is streamed, so MRs are counted as they are analyzed
+        total_mrs = 0
+        for comments in self._fetch_reviews(mrs):
+            total_mrs += 1
             all_comments.extend(comments)
             
             # Filter comments by the specific reviewer
@@ -208,7 +455,7 @@ class GitLabAnalyzer:
             'all_comments': all_comments,
             'reviewer_comments': reviewer_comments,
             'analysis_period': f"{months} months",
-            'total_mrs_analyzed': len(mrs)
+            'total_mrs_analyzed': total_mrs
         }
     
     def _calculate_reviewer_stats(self, comments: List[ReviewComment]) -> ReviewerStats:
@@ -236,30 +483,33 @@ class GitLabAnalyzer:
         reviewer_name = comments[0].author
         total_reviews = len(comments)
         
-        # Count approval statuses
-        approved_count = sum(1 for c in comments if c.approval_status == 'approved')
-        requested_changes_count = sum(1 for c in comments if c.approval_status == 'requested_changes')
-        comment_only_count = sum(1 for c in comments if c.approval_status == 'commented')
-        
-        # Calculate average sentiments
-        textblob_scores = [c.sentiment_textblob for c in comments]
-        avg_sentiment_textblob = sum(textblob_scores) / len(textblob_scores) if textblob_scores else 0.0
-        
-        # Average VADER scores
-        vader_keys = ['compound', 'pos', 'neu', 'neg']
-        avg_sentiment_vader = {}
-        for key in vader_keys:
-            scores = [c.sentiment_vader.get(key, 0) for c in comments]
-            avg_sentiment_vader[key] = sum(scores) / len(scores) if scores else 0.0
-        
-        # Count reviews by author
+        # Count approval statuses, sum sentiments and group by author in one pass
+        status_counts = dict.fromkeys(_APPROVAL_STATUSES, 0)
+        textblob_sum = 0
+        vader_sums = [0] * len(_VADER_KEYS)
         reviewed_authors = defaultdict(int)
         sentiment_by_author = defaultdict(list)
         
         for comment in comments:
+            if comment.approval_status in status_counts:
+                status_counts[comment.approval_status] += 1
+            textblob_sum += comment.sentiment_textblob
+            vader = comment.sentiment_vader
+            for i, key in enumerate(_VADER_KEYS):
+                vader_sums[i] += vader.get(key, 0)
             reviewed_authors[comment.mr_author] += 1
             sentiment_by_author[comment.mr_author].append(comment.sentiment_textblob)
         
+        approved_count = status_counts['approved']
+        requested_changes_count = status_counts['requested_changes']
+        comment_only_count = status_counts['commented']
+        
+        # Calculate average sentiments
+        avg_sentiment_textblob = textblob_sum / total_reviews
+        avg_sentiment_vader = {
+            key: vader_sum / total_reviews for key, vader_sum in zip(_VADER_KEYS, vader_sums)
+        }
+        
         return ReviewerStats(
             reviewer_name=reviewer_name,
             total_reviews=total_reviews,
@@ -272,27 +522,59 @@ class GitLabAnalyzer:
             sentiment_by_author=dict(sentiment_by_author)
         )
     
-    def _calculate_team_stats(self, all_comments: List[ReviewComment]) -> Dict:
+    def _calculate_team_stats(self, all_comments: List[ReviewComment],
+                              table: Optional[CommentTable] = None) -> Dict[str, ReviewerStats]:
         """Calculate team-wide statistics for comparison.
         
         Args:
             all_comments: List of all comments from all reviewers
+            table: Columnar view of all_comments, built here when omitted
             
         Returns:
-            Dictionary with team statistics
+            Dictionary mapping each reviewer to their ReviewerStats
         """
         if not all_comments:
             return {}
         
-        # Group by reviewer
-        reviewer_groups = defaultdict(list)
-        for comment in all_comments:
-            reviewer_groups[comment.author].append(comment)
+        if table is None:
+            table = CommentTable.from_comments(all_comments)
+        n_reviewers = len(table.reviewers)
+        
+        review_counts = np.bincount(table.reviewer_ids, minlength=n_reviewers)
+        status_counts = np.zeros((n_reviewers, len(_APPROVAL_STATUSES)), dtype=np.int64)
+        np.add.at(status_counts, (table.reviewer_ids, table.approval_status), 1)
+        # bincount accumulates in row order, matching sum() over each reviewer
+        avg_textblob = np.bincount(
+            table.reviewer_ids, weights=table.sentiment_textblob, minlength=n_reviewers
+        ) / review_counts
+        avg_vader = np.column_stack([
+            np.bincount(table.reviewer_ids, weights=table.sentiment_vader[:, k], minlength=n_reviewers)
+            for k in range(len(_VADER_KEYS))
+        ]) / review_counts[:, None]
+        
+        reviewed_authors = [{} for _ in range(n_reviewers)]
+        sentiment_by_author = [{} for _ in range(n_reviewers)]
+        _, groups = table.group_pairs()
+        for reviewer_id, mr_author_id, rows in groups:
+            mr_author = table.mr_authors[mr_author_id]
+            reviewed_authors[reviewer_id][mr_author] = len(rows)
+            sentiment_by_author[reviewer_id][mr_author] = table.sentiment_textblob[rows].tolist()
         
         team_stats = {}
-        for reviewer, comments in reviewer_groups.items():
-            stats = self._calculate_reviewer_stats(comments)
-            team_stats[reviewer] = asdict(stats)
+        for reviewer_id, reviewer in enumerate(table.reviewers):
+            counts = status_counts[reviewer_id].tolist()
+            stats = ReviewerStats(
+                reviewer_name=reviewer,
+                total_reviews=int(review_counts[reviewer_id]),
+                approved_count=counts[_STATUS_CODES['approved']],
+                requested_changes_count=counts[_STATUS_CODES['requested_changes']],
+                comment_only_count=counts[_STATUS_CODES['commented']],
+                avg_sentiment_textblob=float(avg_textblob[reviewer_id]),
+                avg_sentiment_vader=dict(zip(_VADER_KEYS, avg_vader[reviewer_id].tolist())),
+                reviewed_authors=reviewed_authors[reviewer_id],
+                sentiment_by_author=sentiment_by_author[reviewer_id]
+            )
+            team_stats[reviewer] = stats
         
         return team_stats
     
@@ -310,70 +592,87 @@ class GitLabAnalyzer:
         
         all_comments = []
         
-        print(f"Analyzing {len(mrs)} merge requests for team patterns...")
+        print(f"Analyzing merge requests since {since_date:%Y-%m-%d} for team patterns...")
         
-        for mr in mrs:
-            comments = self.get_mr_reviews(mr)
+        # The listing is streamed, so MRs are counted as they are analyzed
+        total_mrs = 0
+        for comments in self._fetch_reviews(mrs):
+            total_mrs += 1
             all_comments.extend(comments)
         
+        table = CommentTable.from_comments(all_comments)
+        
         # Calculate team statistics
-        team_stats = self._calculate_team_stats(all_comments)
+        team_stats = self._calculate_team_stats(all_comments, table)
         
         # Calculate cross-team patterns
-        team_patterns = self._analyze_cross_team_patterns(all_comments)
+        team_patterns = self._analyze_cross_team_patterns(all_comments, table)
         
         return {
             'team_stats': team_stats,
             'team_patterns': team_patterns,
             'all_comments': all_comments,
             'analysis_period': f"{months} months",
-            'total_mrs_analyzed': len(mrs),
+            'total_mrs_analyzed': total_mrs,
             'reviewer_stats': None  # No specific reviewer for team analysis
         }
     
-    def _analyze_cross_team_patterns(self, all_comments: List[ReviewComment]) -> Dict:
+    def _analyze_cross_team_patterns(self, all_comments: List[ReviewComment],
+                                     table: Optional[CommentTable] = None) -> Dict:
         """Analyze cross-team interaction patterns.
         
         Args:
             all_comments: List of all comments from all reviewers
+            table: Columnar view of all_comments, built here when omitted
             
         Returns:
             Dictionary with cross-team patterns
         """
         patterns = {
-            'reviewer_to_author_matrix': defaultdict(lambda: defaultdict(list)),
+            'reviewer_to_author_matrix': {},
             'most_active_reviewers': {},
             'most_reviewed_authors': {},
             'sentiment_patterns': {},
             'collaboration_network': {}
         }
         
-        # Build reviewer-to-author matrix
-        for comment in all_comments:
-            patterns['reviewer_to_author_matrix'][comment.author][comment.mr_author].append(comment.sentiment_textblob)
-        
-        # Calculate most active reviewers
-        reviewer_counts = defaultdict(int)
-        for comment in all_comments:
-            reviewer_counts[comment.author] += 1
-        patterns['most_active_reviewers'] = dict(sorted(reviewer_counts.items(), key=lambda x: x[1], reverse=True)[:10])
-        
-        # Calculate most reviewed authors
-        author_counts = defaultdict(int)
-        for comment in all_comments:
-            author_counts[comment.mr_author] += 1
-        patterns['most_reviewed_authors'] = dict(sorted(author_counts.items(), key=lambda x: x[1], reverse=True)[:10])
-        
-        # Calculate sentiment patterns
-        for reviewer, authors in patterns['reviewer_to_author_matrix'].items():
-            patterns['sentiment_patterns'][reviewer] = {}
-            for author, sentiments in authors.items():
-                if sentiments:
-                    patterns['sentiment_patterns'][reviewer][author] = {
-                        'avg_sentiment': sum(sentiments) / len(sentiments),
-                        'review_count': len(sentiments),
-                        'sentiment_std': (sum((s - sum(sentiments)/len(sentiments))**2 for s in sentiments) / len(sentiments))**0.5
-                    }
+        if not all_comments:
+            return patterns
+        
+        if table is None:
+            table = CommentTable.from_comments(all_comments)
+        pair_index, groups = table.group_pairs()
+        
+        # Calculate most active reviewers and most reviewed authors; nlargest
+        # keeps first-appearance order among equal counts, like a stable sort
+        for key, names, codes in (
+            ('most_active_reviewers', table.reviewers, table.reviewer_ids),
+            ('most_reviewed_authors', table.mr_authors, table.mr_author_ids)
+        ):
+            counts = np.bincount(codes, minlength=len(names)).tolist()
+            top = heapq.nlargest(10, range(len(names)), key=counts.__getitem__)
+            patterns[key] = {names[i]: counts[i] for i in top}
+        
+        # Per-pair sentiment moments, accumulated in row order like sum()
+        sentiments = table.sentiment_textblob
+        pair_counts = np.bincount(pair_index)
+        pair_means = np.bincount(pair_index, weights=sentiments) / pair_counts
+        pair_stds = (
+            np.bincount(pair_index, weights=(sentiments - pair_means[pair_index])**2) / pair_counts
+        )**0.5
+        
+        # Build reviewer-to-author matrix and sentiment patterns from the flat
+        # pair groups; each pair is inserted once, into plain (picklable) dicts
+        matrix = patterns['reviewer_to_author_matrix']
+        for pair, (reviewer_id, mr_author_id, rows) in enumerate(groups):
+            reviewer = table.reviewers[reviewer_id]
+            author = table.mr_authors[mr_author_id]
+            matrix.setdefault(reviewer, {})[author] = sentiments[rows].tolist()
+            patterns['sentiment_patterns'].setdefault(reviewer, {})[author] = {
+                'avg_sentiment': float(pair_means[pair]),
+                'review_count': int(pair_counts[pair]),
+                'sentiment_std': float(pair_stds[pair])
+            }
         
         return patterns
 
@@ -390,8 +689,34 @@ class GitLabAnalyzer:
         enhanced_comments = []
         
         try:
-            for comment in comments[:10]:  # Limit to first 10 for demo
-                prompt = f"""
+            comments_to_analyze = comments[:10]  # Limit to first 10 for demo
+            
+            prompts = [self._llm_prompt(comment) for comment in comments_to_analyze]
+            
+            if in_event_loop():
+                analyses = [self._chat(model, prompt) for prompt in prompts]
+            else:
+                # Generations are I/O-bound on the model server, so issue them
+                # concurrently over one client instead of one at a time
+                analyses = asyncio.run(self._chat_concurrently(model, prompts))
+            
+            for comment, analysis in zip(comments_to_analyze, analyses):
+                enhanced_comments.append({
+                    'comment': asdict(comment),
+                    'llm_analysis': analysis
+                })
+                
+        except Exception as e:
+            print(f"LLM analysis failed: {e}")
+            # Return original comments without LLM enhancement
+            enhanced_comments = [{'comment': asdict(c), 'llm_analysis': _LLM_UNAVAILABLE} for c in comments]
+        
+        return enhanced_comments
+    
+    @staticmethod
+    def _llm_prompt(comment: ReviewComment) -> str:
+        """Build the LLM prompt analyzing a single review comment."""
+        return f"""
                 Analyze this code review comment for tone, professionalism, and potential bias:
                 
                 Comment: "{comment.body}"
@@ -406,20 +731,58 @@ class GitLabAnalyzer:
                 
                 Keep response concise (2-3 sentences max).
                 """
-                
-                response = ollama.chat(
-                    model=model,
-                    messages=[{'role': 'user', 'content': prompt}]
-                )
-                
-                enhanced_comments.append({
-                    'comment': asdict(comment),
-                    'llm_analysis': response['message']['content']
-                })
-                
+    
+    @staticmethod
+    def _chat(model: str, prompt: str) -> str:
+        """Send one prompt to Ollama.
+        
+        Args:
+            model: Ollama model to use
+            prompt: Prompt to send
+            
+        Returns:
+            Response content, or a placeholder if the generation failed
+        """
+        try:
+            response = ollama.chat(
+                model=model,
+                messages=[{'role': 'user', 'content': prompt}],
+                options={'num_predict': _LLM_MAX_TOKENS}
+            )
+            return response['message']['content']
         except Exception as e:
             print(f"LLM analysis failed: {e}")
-            # Return original comments without LLM enhancement
-            enhanced_comments = [{'comment': asdict(c), 'llm_analysis': 'LLM analysis unavailable'} for c in comments]
+            return _LLM_UNAVAILABLE
+    
+    @staticmethod
+    async def _chat_concurrently(model: str, prompts: List[str]) -> List[str]:
+        """Send prompts to Ollama concurrently over a single client.
         
-        return enhanced_comments
+        Args:
+            model: Ollama model to use
+            prompts: Prompts to send
+            
+        Returns:
+            Response contents, aligned with prompts; a failed generation gets
+            a placeholder without discarding the others
+        """
+        client = ollama.AsyncClient()
+        
+        async def chat_one(prompt: str) -> str:
+            try:
+                response = await client.chat(
+                    model=model,
+                    messages=[{'role': 'user', 'content': prompt}],
+                    options={'num_predict': _LLM_MAX_TOKENS}
+                )
+                return response['message']['content']
+            except Exception as e:
+                print(f"LLM analysis failed: {e}")
+                return _LLM_UNAVAILABLE
+        
+        try:
+            return await asyncio.gather(*map(chat_one, prompts))
+        finally:
+            # ollama's AsyncClient has no close method; close the httpx
+            # client it wraps so the batch's connections are released
+            await client._client.aclose()
@@ -6,6 +6,7 @@ abstracting away the details of API calls and data transformation.
 """
 
 import os
+import functools
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 
@@ -13,6 +14,7 @@ import gitlab
 from gitlab.v4.objects import Project, MergeRequest
 
 from data_models import ReviewComment, ApprovalStatus, SentimentScore
+from note_classifier import classify_note_body, intern_name
 
 
 class GitLabClient:
@@ -30,7 +32,11 @@ class GitLabClient:
         self.private_token = private_token
         self.project_id = project_id
         self.gl = gitlab.Gitlab(gitlab_url, private_token=private_token)
-        self.project = self.gl.projects.get(project_id)
+    
+    @functools.cached_property
+    def project(self) -> Project:
+        """GitLab project, fetched on first use."""
+        return self.gl.projects.get(self.project_id)
     
     @classmethod
     def from_env(cls) -> 'GitLabClient':
@@ -81,48 +87,51 @@ class GitLabClient:
         
         Args:
             mr: Merge request object
-            sentiment_analyzer: Object with analyze_sentiment method
+            sentiment_analyzer: Object with analyze_batch method
             
         Returns:
             List of ReviewComment objects
         """
         comments = []
         
-        # Get notes (comments)
-        notes = mr.notes.list(all=True)
+        # Get notes (comments), skipping system notes
+        notes = [note for note in mr.notes.list(all=True) if not note.system]
+        mr_author = intern_name(mr.author.get('name', 'Unknown'))
+        
+        # Analyze sentiment of all notes in one batch
+        textblob_scores, vader_scores = sentiment_analyzer.analyze_batch([note.body for note in notes])
+        sentiment_columns = zip(
+            textblob_scores.tolist(),
+            vader_scores['compound'].tolist(),
+            vader_scores['pos'].tolist(),
+            vader_scores['neu'].tolist(),
+            vader_scores['neg'].tolist()
+        )
         
-        for note in notes:
-            if note.system:  # Skip system notes
-                continue
-                
-            # Analyze sentiment
-            textblob_sentiment, vader_sentiment = sentiment_analyzer.analyze_sentiment(note.body)
-            
+        for note, (textblob_score, compound, pos, neu, neg) in zip(notes, sentiment_columns):
             # Determine approval status based on note content
             approval_status = self._determine_approval_status(note, mr)
             
             # Create sentiment score object
             sentiment = SentimentScore(
-                textblob_score=textblob_sentiment,
-                vader_compound=vader_sentiment.get('compound', 0.0),
-                vader_positive=vader_sentiment.get('pos', 0.0),
-                vader_neutral=vader_sentiment.get('neu', 0.0),
-                vader_negative=vader_sentiment.get('neg', 0.0)
+                textblob_score=textblob_score,
+                vader_compound=compound,
+                vader_positive=pos,
+                vader_neutral=neu,
+                vader_negative=neg
             )
             
-            # Parse created_at datetime
-            created_at = datetime.fromisoformat(
-                note.created_at.replace('Z', '+00:00')
-            )
+            # Parse created_at datetime; fromisoformat accepts the 'Z' suffix
+            created_at = datetime.fromisoformat(note.created_at)
             
             comment = ReviewComment(
                 id=str(note.id),
-                author=note.author.get('name', 'Unknown'),
+                author=intern_name(note.author.get('name', 'Unknown')),
                 body=note.body,
                 created_at=created_at,
                 mr_id=mr.id,
                 mr_title=mr.title,
-                mr_author=mr.author.get('name', 'Unknown'),
+                mr_author=mr_author,
                 sentiment=sentiment,
                 approval_status=approval_status
             )
@@ -141,27 +150,7 @@ class GitLabClient:
             ApprovalStatus enum value
         """
         # Check if this note contains approval/request changes indicators
-        body_lower = note.body.lower()
-        
-        # Look for approval indicators
-        approval_keywords = [
-            'approved', 'lgtm', 'looks good', 'approve', 'ship it',
-            ':+1:', '👍', ':thumbsup:', 'ready to merge'
-        ]
-        
-        # Look for request changes indicators
-        changes_keywords = [
-            'request changes', 'needs changes', 'please fix', 'fix this',
-            'don\'t merge', 'not ready', 'block', 'blocking', 'nack',
-            ':-1:', '👎', ':thumbsdown:'
-        ]
-        
-        if any(keyword in body_lower for keyword in approval_keywords):
-            return ApprovalStatus.APPROVED
-        elif any(keyword in body_lower for keyword in changes_keywords):
-            return ApprovalStatus.REQUESTED_CHANGES
-        else:
-            return ApprovalStatus.COMMENTED
+        return ApprovalStatus(classify_note_body(note.body))
     
     def get_mr_details(self, mr: MergeRequest) -> Dict[str, Any]:
         """Get additional details about a merge request.
@@ -173,7 +162,7 @@ class GitLabClient:
             Dictionary with additional MR details
         """
         # Calculate review and merge times
-        created_at = datetime.fromisoformat(mr.created_at.replace('Z', '+00:00'))
+        created_at = datetime.fromisoformat(mr.created_at)
         
         details = {
             'id': mr.id,
@@ -187,13 +176,13 @@ class GitLabClient:
         
         # Add merge time if available
         if hasattr(mr, 'merged_at') and mr.merged_at:
-            merged_at = datetime.fromisoformat(mr.merged_at.replace('Z', '+00:00'))
+            merged_at = datetime.fromisoformat(mr.merged_at)
             details['merged_at'] = merged_at
             details['merge_time_hours'] = (merged_at - created_at).total_seconds() / 3600
         
         # Add updated time
         if hasattr(mr, 'updated_at') and mr.updated_at:
-            updated_at = datetime.fromisoformat(mr.updated_at.replace('Z', '+00:00'))
+            updated_at = datetime.fromisoformat(mr.updated_at)
             details['updated_at'] = updated_at
             details['review_time_hours'] = (updated_at - created_at).total_seconds() / 3600
         
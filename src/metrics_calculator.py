@@ -1,90 +1,419 @@
 """
 Core metrics calculation logic for GitLab review analysis.
 """
-import statistics
-from typing import Dict, List, Any, Tuple, Optional
-from collections import defaultdict, Counter
+import re
+import calendar
+from typing import Dict, List, Any, Tuple, Optional, Callable, Hashable, Iterator, Union
+from collections import defaultdict, Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from operator import attrgetter
 from datetime import datetime, timedelta
 
+import numpy as np
+import pandas as pd
+
 try:
     # Try relative imports first (when used as package)
-    from .models import DeveloperMetrics, ProjectMetrics, ReviewComment
+    from .models import DeveloperMetrics, ProjectMetrics, ReviewComment, ReviewCommentFrame
+    from .worker_pool import resolve_max_workers
 except ImportError:
     # Fall back to absolute imports (when used directly)
-    from models import DeveloperMetrics, ProjectMetrics, ReviewComment
+    from models import DeveloperMetrics, ProjectMetrics, ReviewComment, ReviewCommentFrame
+    from worker_pool import resolve_max_workers
+
+
+# Keywords marking a comment as constructive, matched anywhere in the body
+# ("reconsider", "betterment") in a single case-insensitive scan
+_CONSTRUCTIVE_KEYWORDS = ['suggest', 'recommend', 'consider', 'improve', 'better']
+_CONSTRUCTIVE_RE = re.compile('|'.join(_CONSTRUCTIVE_KEYWORDS), re.IGNORECASE)
+
+# Approval statuses as coded in CommentArrays.approval_codes
+APPROVAL_STATUSES = ('approved', 'requested_changes', 'commented')
+_APPROVAL_CODES = {status: code for code, status in enumerate(APPROVAL_STATUSES)}
+_APPROVED, _REQUESTED_CHANGES, _COMMENTED = range(len(APPROVAL_STATUSES))
+
+# Sentiment polarity bands used by the ratio statistics
+_NEUTRAL_BAND = 0.1
+
+# Derived data and results kept per MetricsCalculator, least recently used
+# first out; each entry holds its source lists alive
+_METRICS_CACHE_SIZE = 1024
+
+# Metrics of a developer with no MRs and no comments made or received, as
+# computed by the full path; copied with the developer's name
+_INACTIVE_DEVELOPER_METRICS = DeveloperMetrics(
+    name='', total_mrs=0, merged_mrs=0, closed_mrs=0,
+    avg_review_time=0, avg_merge_time=0,
+    comments_made=0, comments_received=0,
+    approvals_given=0, approvals_received=0,
+    change_requests_made=0, change_requests_received=0,
+    lines_added=0, lines_removed=0, commits=0,
+    avg_time_to_approve=24.0
+)
+
+# Field getters for the C-level map() passes over comment lists
+_get_body = attrgetter('body')
+_get_sentiment = attrgetter('sentiment_textblob')
+_get_created_at = attrgetter('created_at')
+
+# Comments are accepted as a list or, for the columnar fast paths, a frame
+Comments = Union[List[ReviewComment], ReviewCommentFrame]
+
+
+@dataclass
+class DeveloperIndex:
+    """Per-developer row indices and counters, built in one pass over comments and MRs."""
+    comments_by_author: Dict[str, List[int]] = field(default_factory=lambda: defaultdict(list))
+    comments_by_mr_author: Dict[str, List[int]] = field(default_factory=lambda: defaultdict(list))
+    mrs_by_author: Dict[str, List[int]] = field(default_factory=lambda: defaultdict(list))
+    approvals_given: Dict[str, int] = field(default_factory=Counter)
+    approvals_received: Dict[str, int] = field(default_factory=Counter)
+    change_requests_made: Dict[str, int] = field(default_factory=Counter)
+    change_requests_received: Dict[str, int] = field(default_factory=Counter)
+    negative_comments_made: Dict[str, int] = field(default_factory=Counter)
+
+
+@dataclass
+class CommentArrays:
+    """Columnar view of the comment fields read by the statistics kernels.
+    
+    Authors and MR authors are coded separately in order of first appearance,
+    so iterating codes in ascending order follows comment order.
+    """
+    sentiment: np.ndarray
+    author_codes: np.ndarray
+    mr_author_codes: np.ndarray
+    approval_codes: np.ndarray  # codes into APPROVAL_STATUSES
+    author_vocab: List[str]
+    mr_author_vocab: List[str]
+    polarity: np.ndarray = field(init=False)  # int8: -1 negative, 0 neutral, 1 positive
+    
+    def __post_init__(self):
+        self.polarity = (
+            (self.sentiment > _NEUTRAL_BAND).astype(np.int8) - (self.sentiment < -_NEUTRAL_BAND)
+        ).astype(np.int8)
+    
+    @classmethod
+    def from_comments(cls, comments: Comments) -> 'CommentArrays':
+        """Build the arrays in one pass over the comments."""
+        if isinstance(comments, ReviewCommentFrame):
+            return cls.from_frame(comments.df)
+        
+        n = len(comments)
+        author_vocab = {}
+        mr_author_vocab = {}
+        sentiment = np.empty(n, dtype=np.float64)
+        author_codes = np.empty(n, dtype=np.int32)
+        mr_author_codes = np.empty(n, dtype=np.int32)
+        approval_codes = np.empty(n, dtype=np.int8)
+        
+        for i, comment in enumerate(comments):
+            sentiment[i] = comment.sentiment_textblob
+            author_codes[i] = author_vocab.setdefault(comment.author, len(author_vocab))
+            mr_author_codes[i] = mr_author_vocab.setdefault(comment.mr_author, len(mr_author_vocab))
+            approval_codes[i] = _APPROVAL_CODES.get(comment.approval_status, _COMMENTED)
+        
+        return cls(sentiment, author_codes, mr_author_codes, approval_codes,
+                   list(author_vocab), list(mr_author_vocab))
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'CommentArrays':
+        """Build the arrays from the columns of a ReviewCommentFrame."""
+        author_codes, author_vocab = pd.factorize(df['author'])
+        mr_author_codes, mr_author_vocab = pd.factorize(df['mr_author'])
+        approval_codes = (
+            df['approval_status'].astype(object).map(_APPROVAL_CODES).fillna(_COMMENTED).to_numpy(np.int8)
+        )
+        return cls(df['sentiment_textblob'].to_numpy(np.float64),
+                   author_codes.astype(np.int32), mr_author_codes.astype(np.int32), approval_codes,
+                   list(author_vocab), list(mr_author_vocab))
+
+
+def _comment_fields(comments: Comments, *names: str) -> Iterator[Tuple]:
+    """Tuples of the named fields per comment, read column-wise from a frame."""
+    if isinstance(comments, ReviewCommentFrame):
+        return zip(*(comments.df[name] for name in names))
+    return map(attrgetter(*names), comments)
+
+
+def _mean(values: np.ndarray) -> float:
+    """Mean accumulated in extended precision, matching statistics.mean."""
+    return float(values.sum(dtype=np.longdouble) / values.size)
+
+
+def _fast_median(values: np.ndarray) -> float:
+    """Median by selecting the middle element(s) in O(N) rather than sorting."""
+    n = values.size
+    lo, hi = (n - 1) // 2, n // 2
+    middle = np.partition(values, (lo, hi))
+    return float((middle[lo] + middle[hi]) / 2)
+
+
+def _group_means(codes: np.ndarray, values: np.ndarray, n_groups: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-group means and sizes.
+    
+    Sums accumulate in extended precision so the means match statistics.mean
+    for the threshold comparisons made on them.
+    """
+    sums = np.zeros(n_groups, dtype=np.longdouble)
+    np.add.at(sums, codes, values)
+    counts = np.bincount(codes, minlength=n_groups)
+    with np.errstate(invalid='ignore'):
+        means = (sums / counts).astype(np.float64)
+    return means, counts
+
+
+def _group_stdevs(codes: np.ndarray, values: np.ndarray, means: np.ndarray,
+                  counts: np.ndarray) -> np.ndarray:
+    """Per-group sample standard deviations; NaN for groups of fewer than two."""
+    squared_deviations = np.bincount(codes, weights=(values - means[codes])**2, minlength=len(counts))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.sqrt(squared_deviations / (counts - 1))
+
+
+def _approval_counts(codes: np.ndarray, approval_codes: np.ndarray, n_groups: int) -> np.ndarray:
+    """Per-group counts of each approval status, one row per group and one column per status."""
+    n_statuses = len(APPROVAL_STATUSES)
+    flat = np.bincount(codes.astype(np.int64) * n_statuses + approval_codes, minlength=n_groups * n_statuses)
+    return flat.reshape(n_groups, n_statuses)
+
+
+def _bucket_statistics(keys: np.ndarray, values: np.ndarray,
+                       order_by: np.ndarray) -> List[Tuple[int, float, int, float]]:
+    """Mean, size and sample standard deviation of values per key.
+    
+    Keys are returned in order of their smallest order_by value, the order
+    in which they would first appear were the rows sorted by it.
+    """
+    codes, uniques = pd.factorize(keys)
+    means, counts = _group_means(codes, values, len(uniques))
+    stds = _group_stdevs(codes, values, means, counts)
+    
+    first = np.full(len(uniques), np.iinfo(np.int64).max, dtype=np.int64)
+    np.minimum.at(first, codes, order_by)
+    return [
+        (int(uniques[i]), float(means[i]), int(counts[i]), float(stds[i]))
+        for i in np.argsort(first, kind='stable')
+    ]
+
+
+def _to_datetime_index(values: List[datetime]) -> pd.DatetimeIndex:
+    """Datetimes as an index for vectorized field access, in their own wall-clock time.
+    
+    Timestamps carrying different UTC offsets cannot share one index, so
+    those are converted to UTC.
+    """
+    try:
+        return pd.DatetimeIndex(values)
+    except ValueError:
+        return pd.DatetimeIndex(pd.to_datetime(values, utc=True))
+
+
+def _parse_timestamps(values: List[Any]) -> pd.Series:
+    """Parse ISO-8601 strings or datetimes in one vectorized pass; missing values become NaT."""
+    return pd.to_datetime(pd.Series(values, dtype=object), utc=True, format='ISO8601', errors='coerce')
+
+
+def _hours_between(start: pd.Series, end: pd.Series) -> np.ndarray:
+    """Hours from start to end per row, NaN where either timestamp is missing."""
+    return ((end - start).dt.total_seconds() / 3600).to_numpy(dtype=np.float64)
+
+
+def _mean_or_zero(hours: np.ndarray) -> float:
+    """Mean of the non-missing durations, or 0 when there are none."""
+    hours = hours[~np.isnan(hours)]
+    return float(hours.mean()) if hours.size else 0
 
 
 class MetricsCalculator:
     """Calculates various metrics for GitLab review analysis."""
     
     def __init__(self):
-        self.metrics_cache = {}
+        # (kind, *source ids) -> (sources, source lengths, value), in LRU order
+        self.metrics_cache = OrderedDict()
+        # Cache lookups: hits, cold misses, stale entries rebuilt, and entries
+        # evicted to stay within _METRICS_CACHE_SIZE
+        self.cache_stats = Counter()
     
-    def calculate_developer_metrics(self, developer_name: str, comments: List[ReviewComment], 
-                                  mrs_data: List[Dict]) -> DeveloperMetrics:
-        """Calculate comprehensive metrics for a developer."""
-        
-        # Basic MR statistics
-        dev_mrs = [mr for mr in mrs_data if mr.get('author', {}).get('name') == developer_name]
+    def clear_cache(self):
+        """Drop all cached derived data and results, e.g. after mutating input lists in place."""
+        self.metrics_cache.clear()
+        self.cache_stats.clear()
+    
+    def _cached(self, kind: Hashable, sources: Tuple, build: Callable[[], Any]) -> Any:
+        """Return a value derived from sources, building it once per set of source lists.
+        
+        Entries are keyed by the identity of the source lists and keep a
+        reference to them, so ids cannot be reused while an entry is alive;
+        a changed length invalidates the entry. At most _METRICS_CACHE_SIZE
+        entries are kept, evicting the least recently used.
+        """
+        key = (kind, *map(id, sources))
+        lengths = tuple(map(len, sources))
+        entry = self.metrics_cache.get(key)
+        if entry is None:
+            self.cache_stats['misses'] += 1
+        else:
+            cached_sources, cached_lengths, value = entry
+            if cached_lengths == lengths and all(a is b for a, b in zip(cached_sources, sources)):
+                self.cache_stats['hits'] += 1
+                self.metrics_cache.move_to_end(key)
+                return value
+            self.cache_stats['stale'] += 1
+        
+        value = build()
+        self.metrics_cache[key] = (sources, lengths, value)
+        self.metrics_cache.move_to_end(key)
+        while len(self.metrics_cache) > _METRICS_CACHE_SIZE:
+            self.metrics_cache.popitem(last=False)
+            self.cache_stats['evicted'] += 1
+        return value
+    
+    def _mr_durations(self, mrs_data: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """Review and merge time of every MR in hours, NaN where unavailable.
+        
+        Review time runs from creation to last update and merge time from
+        creation to merge. Timestamps are parsed once per mrs_data list.
+        """
+        def build():
+            created = _parse_timestamps([mr.get('created_at') for mr in mrs_data])
+            updated = _parse_timestamps([mr.get('updated_at') for mr in mrs_data])
+            merged = _parse_timestamps([mr.get('merged_at') for mr in mrs_data])
+            return _hours_between(created, updated), _hours_between(created, merged)
+        
+        return self._cached('mr_durations', (mrs_data,), build)
+    
+    def _comment_arrays(self, comments: Comments) -> CommentArrays:
+        """Columnar view of comments, built once per comments list."""
+        return self._cached('comment_arrays', (comments,), lambda: CommentArrays.from_comments(comments))
+    
+    def precompute_developer_indices(self, comments: Comments,
+                                     mrs_data: List[Dict]) -> DeveloperIndex:
+        """Index comments and MRs by developer in a single pass over each list."""
+        index = DeveloperIndex()
+        
+        rows = _comment_fields(comments, 'author', 'mr_author', 'approval_status', 'sentiment_textblob')
+        for i, (author, mr_author, approval_status, sentiment) in enumerate(rows):
+            index.comments_by_author[author].append(i)
+            index.comments_by_mr_author[mr_author].append(i)
+            
+            if approval_status == 'approved':
+                index.approvals_given[author] += 1
+                index.approvals_received[mr_author] += 1
+            elif approval_status == 'requested_changes':
+                index.change_requests_made[author] += 1
+                index.change_requests_received[mr_author] += 1
+            
+            if sentiment < -0.2:
+                index.negative_comments_made[author] += 1
         
-        total_mrs = len(dev_mrs)
-        merged_mrs = len([mr for mr in dev_mrs if mr.get('state') == 'merged'])
-        closed_mrs = len([mr for mr in dev_mrs if mr.get('state') == 'closed'])
+        for i, mr in enumerate(mrs_data):
+            index.mrs_by_author[mr.get('author', {}).get('name')].append(i)
         
-        # Review time calculations
-        review_times = []
-        merge_times = []
+        return index
+    
+    def calculate_developer_metrics(self, developer_name: str, comments: Comments, 
+                                  mrs_data: List[Dict],
+                                  index: Optional[DeveloperIndex] = None) -> DeveloperMetrics:
+        """Calculate comprehensive metrics for a developer.
+        
+        Without an index, results are memoized per developer and comments/MRs
+        pair; the returned DeveloperMetrics is shared between calls and should
+        be treated as read-only. The developer index is built once per
+        comments/MRs pair and reused across developers. A passed-in index is
+        used as is and its result is not memoized.
+        """
+        if index is not None:
+            return self._compute_developer_metrics(developer_name, mrs_data, index)
+        return self._memoized_developer_metrics(developer_name, comments, mrs_data)
+    
+    def calculate_all_developer_metrics(self, developers: List[str], comments: Comments,
+                                        mrs_data: List[Dict],
+                                        max_workers: Optional[int] = None) -> Dict[str, DeveloperMetrics]:
+        """Calculate metrics for several developers over the same comments and MRs.
+        
+        The developer index is built once and shared. With more than one worker
+        (by default one per CPU once there are enough developers) the developers
+        are spread over worker processes, each of which receives the MRs and the
+        index once rather than once per developer; otherwise they are computed
+        here and memoized like calculate_developer_metrics.
+        """
+        index = self._developer_index(comments, mrs_data)
+        
+        max_workers = resolve_max_workers(max_workers, len(developers))
+        if max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_developer_worker,
+                                     initargs=(mrs_data, index)) as executor:
+                chunksize = max(1, len(developers) // (max_workers * 4))
+                metrics = list(executor.map(_developer_metrics_worker, developers, chunksize=chunksize))
+        else:
+            metrics = [self._memoized_developer_metrics(name, comments, mrs_data) for name in developers]
         
-        for mr in dev_mrs:
-            created_at = mr.get('created_at')
-            merged_at = mr.get('merged_at')
-            updated_at = mr.get('updated_at')
-            
-            if created_at and updated_at:
-                # Calculate time from creation to last update (review time)
-                if isinstance(created_at, str):
-                    created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                if isinstance(updated_at, str):
-                    updated_at = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-                
-                review_time = (updated_at - created_at).total_seconds() / 3600  # hours
-                review_times.append(review_time)
-            
-            if created_at and merged_at:
-                # Calculate time from creation to merge
-                if isinstance(created_at, str):
-                    created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                if isinstance(merged_at, str):
-                    merged_at = datetime.fromisoformat(merged_at.replace('Z', '+00:00'))
-                
-                merge_time = (merged_at - created_at).total_seconds() / 3600  # hours
-                merge_times.append(merge_time)
+        return dict(zip(developers, metrics))
+    
+    def _memoized_developer_metrics(self, developer_name: str, comments: Comments,
+                                    mrs_data: List[Dict]) -> DeveloperMetrics:
+        """Developer metrics from the cached developer index, memoized per developer and comments/MRs pair."""
+        return self._cached(
+            ('developer_metrics', developer_name), (comments, mrs_data),
+            lambda: self._compute_developer_metrics(
+                developer_name, mrs_data, self._developer_index(comments, mrs_data)
+            )
+        )
+    
+    def _developer_index(self, comments: Comments, mrs_data: List[Dict]) -> DeveloperIndex:
+        """Developer index, built once per comments/MRs pair."""
+        return self._cached(
+            'developer_index', (comments, mrs_data),
+            lambda: self.precompute_developer_indices(comments, mrs_data)
+        )
+    
+    def _compute_developer_metrics(self, developer_name: str, mrs_data: List[Dict],
+                                   index: DeveloperIndex) -> DeveloperMetrics:
+        """Compute a developer's metrics without consulting the result cache."""
+        if (developer_name not in index.mrs_by_author
+                and developer_name not in index.comments_by_author
+                and developer_name not in index.comments_by_mr_author):
+            return replace(_INACTIVE_DEVELOPER_METRICS, name=developer_name)
+        
+        # Basic MR statistics and code contribution metrics (would need to be
+        # extracted from MR data), accumulated in one pass over the developer's MRs
+        dev_rows = index.mrs_by_author.get(developer_name, [])
+        
+        total_mrs = len(dev_rows)
+        merged_mrs = closed_mrs = 0
+        lines_added = 0
+        lines_removed = 0  # Would need specific API data
+        commits = 0
+        for i in dev_rows:
+            mr = mrs_data[i]
+            state = mr.get('state')
+            if state == 'merged':
+                merged_mrs += 1
+            elif state == 'closed':
+                closed_mrs += 1
+            lines_added += mr.get('changes_count', 0)
+            commits += len(mr.get('commits', []))
         
-        avg_review_time = statistics.mean(review_times) if review_times else 0
-        avg_merge_time = statistics.mean(merge_times) if merge_times else 0
+        # Review time calculations
+        review_hours, merge_hours = self._mr_durations(mrs_data)
+        avg_review_time = _mean_or_zero(review_hours[dev_rows])
+        avg_merge_time = _mean_or_zero(merge_hours[dev_rows])
         
         # Comment analysis
-        dev_comments = [c for c in comments if c.author == developer_name]
-        received_comments = [c for c in comments if c.mr_author == developer_name]
-        
-        comments_made = len(dev_comments)
-        comments_received = len(received_comments)
+        comments_made = len(index.comments_by_author.get(developer_name, ()))
+        comments_received = len(index.comments_by_mr_author.get(developer_name, ()))
         
         # Approval analysis
-        approvals_given = len([c for c in dev_comments if c.approval_status == 'approved'])
-        approvals_received = len([c for c in received_comments if c.approval_status == 'approved'])
-        
-        change_requests_made = len([c for c in dev_comments if c.approval_status == 'requested_changes'])
-        change_requests_received = len([c for c in received_comments if c.approval_status == 'requested_changes'])
+        approvals_given = index.approvals_given[developer_name]
+        approvals_received = index.approvals_received[developer_name]
         
-        # Code contribution metrics (would need to be extracted from MR data)
-        lines_added = sum([mr.get('changes_count', 0) for mr in dev_mrs])
-        lines_removed = 0  # Would need specific API data
-        commits = sum([len(mr.get('commits', [])) for mr in dev_mrs])
+        change_requests_made = index.change_requests_made[developer_name]
+        change_requests_received = index.change_requests_received[developer_name]
         
         # Calculate negative behavior metrics
-        negative_sentiment_comments = [c for c in dev_comments if c.sentiment_textblob < -0.2]
-        negative_comments_ratio = len(negative_sentiment_comments) / max(comments_made, 1)
+        negative_comments_ratio = index.negative_comments_made[developer_name] / max(comments_made, 1)
         
         # Excessive commenting (more than 10 comments per MR on average)
         if total_mrs > 0:
@@ -126,7 +455,7 @@ class MetricsCalculator:
             rejection_rate=rejection_rate
         )
     
-    def calculate_project_metrics(self, all_comments: List[ReviewComment], 
+    def calculate_project_metrics(self, all_comments: Comments, 
                                 mrs_data: List[Dict]) -> ProjectMetrics:
         """Calculate overall project metrics."""
         
@@ -135,40 +464,15 @@ class MetricsCalculator:
         
         # Get unique developers
         developers = set()
-        for comment in all_comments:
-            developers.add(comment.author)
-            developers.add(comment.mr_author)
+        for author, mr_author in _comment_fields(all_comments, 'author', 'mr_author'):
+            developers.add(author)
+            developers.add(mr_author)
         total_developers = len(developers)
         
         # Calculate average review and merge times
-        review_times = []
-        merge_times = []
-        
-        for mr in mrs_data:
-            created_at = mr.get('created_at')
-            merged_at = mr.get('merged_at')
-            updated_at = mr.get('updated_at')
-            
-            if created_at and updated_at:
-                if isinstance(created_at, str):
-                    created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                if isinstance(updated_at, str):
-                    updated_at = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-                
-                review_time = (updated_at - created_at).total_seconds() / 3600
-                review_times.append(review_time)
-            
-            if created_at and merged_at:
-                if isinstance(created_at, str):
-                    created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                if isinstance(merged_at, str):
-                    merged_at = datetime.fromisoformat(merged_at.replace('Z', '+00:00'))
-                
-                merge_time = (merged_at - created_at).total_seconds() / 3600
-                merge_times.append(merge_time)
-        
-        avg_review_time = statistics.mean(review_times) if review_times else 0
-        avg_merge_time = statistics.mean(merge_times) if merge_times else 0
+        review_hours, merge_hours = self._mr_durations(mrs_data)
+        avg_review_time = _mean_or_zero(review_hours)
+        avg_merge_time = _mean_or_zero(merge_hours)
         
         # Calculate collaboration score based on comment distribution
         collaboration_score = self._calculate_collaboration_score(all_comments)
@@ -186,53 +490,54 @@ class MetricsCalculator:
             code_quality_score=code_quality_score
         )
     
-    def _calculate_collaboration_score(self, comments: List[ReviewComment]) -> float:
+    def _calculate_collaboration_score(self, comments: Comments) -> float:
         """Calculate collaboration score based on review participation."""
         if not comments:
             return 0.0
         
-        # Count interactions between different people
-        interactions = defaultdict(set)
-        for comment in comments:
-            interactions[comment.author].add(comment.mr_author)
-            interactions[comment.mr_author].add(comment.author)
+        # Count interactions between different people: code everyone in one
+        # vocabulary and count the distinct partners of each person
+        arrays = self._comment_arrays(comments)
+        people = {name: code for code, name in enumerate(arrays.author_vocab)}
+        mr_author_people = np.array(
+            [people.setdefault(name, len(people)) for name in arrays.mr_author_vocab], dtype=np.int64
+        )
+        n_people = len(people)
+        authors = arrays.author_codes.astype(np.int64)
+        mr_authors = mr_author_people[arrays.mr_author_codes]
         
-        # Calculate average number of people each person interacts with
-        if not interactions:
-            return 0.0
+        pairs = np.unique(np.concatenate([authors * n_people + mr_authors,
+                                          mr_authors * n_people + authors]))
+        interaction_counts = np.bincount(pairs // n_people, minlength=n_people)
         
-        interaction_counts = [len(people) for people in interactions.values()]
-        avg_interactions = statistics.mean(interaction_counts)
+        # Calculate average number of people each person interacts with
+        avg_interactions = float(interaction_counts.mean())
         
         # Normalize to 0-100 scale (assuming max 10 interactions is excellent)
         collaboration_score = min(100, (avg_interactions / 10) * 100)
         
         return collaboration_score
     
-    def _calculate_code_quality_score(self, comments: List[ReviewComment], 
+    def _calculate_code_quality_score(self, comments: Comments, 
                                     mrs_data: List[Dict]) -> float:
         """Calculate code quality score based on review patterns."""
         if not comments or not mrs_data:
             return 50.0  # Neutral score
         
         # Count constructive comments vs total comments
-        constructive_comments = 0
         total_comments = len(comments)
-        
-        constructive_keywords = ['suggest', 'recommend', 'consider', 'improve', 'better']
-        
-        for comment in comments:
-            body_lower = comment.body.lower()
-            if any(keyword in body_lower for keyword in constructive_keywords):
-                constructive_comments += 1
+        if isinstance(comments, ReviewCommentFrame):
+            df = comments.df
+            constructive_comments = int(df['body'].str.contains(_CONSTRUCTIVE_RE).sum())
+            changed_titles = set(df.loc[df['approval_status'] == 'requested_changes', 'mr_title'])
+        else:
+            constructive_comments = sum(1 for match in map(_CONSTRUCTIVE_RE.search, map(_get_body, comments)) if match)
+            changed_titles = {c.mr_title for c in comments if c.approval_status == 'requested_changes'}
         
         constructive_ratio = constructive_comments / max(total_comments, 1)
         
         # Count MRs that required changes vs total MRs
-        mrs_with_changes = len([mr for mr in mrs_data if any(
-            c.mr_title == mr.get('title', '') and c.approval_status == 'requested_changes'
-            for c in comments
-        )])
+        mrs_with_changes = sum(1 for mr in mrs_data if mr.get('title', '') in changed_titles)
         
         change_ratio = mrs_with_changes / max(len(mrs_data), 1)
         
@@ -242,7 +547,7 @@ class MetricsCalculator:
         
         return min(100, max(0, quality_score))
     
-    def calculate_sentiment_statistics(self, comments: List[ReviewComment]) -> Dict[str, float]:
+    def calculate_sentiment_statistics(self, comments: Comments) -> Dict[str, float]:
         """Calculate comprehensive sentiment statistics."""
         if not comments:
             return {
@@ -256,20 +561,24 @@ class MetricsCalculator:
                 'neutral_ratio': 0.0
             }
         
-        sentiments = [comment.sentiment_textblob for comment in comments]
+        arrays = self._comment_arrays(comments)
+        arr = arrays.sentiment
         
-        mean_sentiment = statistics.mean(sentiments)
-        median_sentiment = statistics.median(sentiments)
-        std_dev = statistics.stdev(sentiments) if len(sentiments) > 1 else 0.0
-        min_sentiment = min(sentiments)
-        max_sentiment = max(sentiments)
+        # The deviations reuse the mean rather than having std recompute it
+        mean_sentiment = _mean(arr)
+        median_sentiment = _fast_median(arr)
+        if arr.size > 1:
+            deviations = arr - mean_sentiment
+            std_dev = float(np.sqrt(np.dot(deviations, deviations) / (arr.size - 1)))
+        else:
+            std_dev = 0.0
+        min_sentiment = float(arr.min())
+        max_sentiment = float(arr.max())
         
-        # Calculate ratios
-        positive_count = sum(1 for s in sentiments if s > 0.1)
-        negative_count = sum(1 for s in sentiments if s < -0.1)
-        neutral_count = len(sentiments) - positive_count - negative_count
+        # Calculate ratios from the polarity bands classified once per comments list
+        negative_count, neutral_count, positive_count = np.bincount(arrays.polarity + 1, minlength=3).tolist()
         
-        total = len(sentiments)
+        total = arr.size
         positive_ratio = positive_count / total
         negative_ratio = negative_count / total
         neutral_ratio = neutral_count / total
@@ -285,56 +594,46 @@ class MetricsCalculator:
             'neutral_ratio': neutral_ratio
         }
     
-    def calculate_reviewer_consistency(self, comments: List[ReviewComment]) -> Dict[str, float]:
+    def calculate_reviewer_consistency(self, comments: Comments) -> Dict[str, float]:
         """Calculate consistency metrics for reviewers."""
-        reviewer_sentiments = defaultdict(list)
-        reviewer_approval_rates = defaultdict(lambda: {'approved': 0, 'changes': 0, 'comments': 0})
+        arrays = self._comment_arrays(comments)
+        n_reviewers = len(arrays.author_vocab)
         
-        for comment in comments:
-            reviewer = comment.author
-            reviewer_sentiments[reviewer].append(comment.sentiment_textblob)
-            reviewer_approval_rates[reviewer][comment.approval_status] += 1
+        means, review_counts = _group_means(arrays.author_codes, arrays.sentiment, n_reviewers)
+        stds = _group_stdevs(arrays.author_codes, arrays.sentiment, means, review_counts)
+        approval_counts = _approval_counts(arrays.author_codes, arrays.approval_codes, n_reviewers)
         
         consistency_scores = {}
         
-        for reviewer, sentiments in reviewer_sentiments.items():
-            if len(sentiments) < 3:  # Need minimum data for consistency analysis
+        for code, reviewer in enumerate(arrays.author_vocab):
+            total_reviews = int(review_counts[code])
+            if total_reviews < 3:  # Need minimum data for consistency analysis
                 consistency_scores[reviewer] = 50.0  # Neutral score
                 continue
             
             # Calculate sentiment consistency (lower std dev = more consistent)
-            sentiment_std = statistics.stdev(sentiments)
-            sentiment_consistency = max(0, 100 - (sentiment_std * 100))
-            
-            # Calculate approval pattern consistency
-            approvals = reviewer_approval_rates[reviewer]
-            total_reviews = sum(approvals.values())
+            sentiment_consistency = max(0, 100 - (float(stds[code]) * 100))
             
-            if total_reviews > 0:
-                approval_rate = approvals['approved'] / total_reviews
-                change_rate = approvals['changes'] / total_reviews
-                
-                # Consistent reviewers have moderate approval rates (not too high or low)
-                optimal_approval_rate = 0.6  # 60% approval rate is considered balanced
-                approval_consistency = 100 - abs(approval_rate - optimal_approval_rate) * 100
-            else:
-                approval_consistency = 50.0
+            # Calculate approval pattern consistency; consistent reviewers have
+            # moderate approval rates (not too high or low)
+            approval_rate = int(approval_counts[code, _APPROVED]) / total_reviews
+            optimal_approval_rate = 0.6  # 60% approval rate is considered balanced
+            approval_consistency = 100 - abs(approval_rate - optimal_approval_rate) * 100
             
             # Combine scores
             consistency_scores[reviewer] = (sentiment_consistency + approval_consistency) / 2
         
         return consistency_scores
     
-    def calculate_bias_indicators(self, comments: List[ReviewComment]) -> Dict[str, Any]:
+    def calculate_bias_indicators(self, comments: Comments) -> Dict[str, Any]:
         """Calculate potential bias indicators."""
-        author_sentiments = defaultdict(list)
-        author_approval_rates = defaultdict(lambda: {'approved': 0, 'changes': 0, 'comments': 0})
-        
         # Group by MR author (who is being reviewed)
-        for comment in comments:
-            mr_author = comment.mr_author
-            author_sentiments[mr_author].append(comment.sentiment_textblob)
-            author_approval_rates[mr_author][comment.approval_status] += 1
+        arrays = self._comment_arrays(comments)
+        n_authors = len(arrays.mr_author_vocab)
+        
+        means, review_counts = _group_means(arrays.mr_author_codes, arrays.sentiment, n_authors)
+        stds = _group_stdevs(arrays.mr_author_codes, arrays.sentiment, means, review_counts)
+        approval_counts = _approval_counts(arrays.mr_author_codes, arrays.approval_codes, n_authors)
         
         bias_indicators = {
             'sentiment_variance': {},
@@ -344,105 +643,86 @@ class MetricsCalculator:
         }
         
         # Calculate sentiment variance for each author
-        all_sentiments = []
-        for author, sentiments in author_sentiments.items():
-            if len(sentiments) >= 3:  # Minimum data requirement
-                author_mean = statistics.mean(sentiments)
-                author_std = statistics.stdev(sentiments) if len(sentiments) > 1 else 0
+        for code, author in enumerate(arrays.mr_author_vocab):
+            sample_size = int(review_counts[code])
+            if sample_size >= 3:  # Minimum data requirement
+                author_mean = float(means[code])
                 
                 bias_indicators['sentiment_variance'][author] = {
                     'mean': author_mean,
-                    'std_dev': author_std,
-                    'sample_size': len(sentiments)
+                    'std_dev': float(stds[code]),
+                    'sample_size': sample_size
                 }
                 
-                all_sentiments.extend(sentiments)
-                
                 # Flag potential bias targets (consistently negative treatment)
-                if author_mean < -0.3 and len(sentiments) >= 5:
+                if author_mean < -0.3 and sample_size >= 5:
                     bias_indicators['potential_bias_targets'].append({
                         'author': author,
                         'mean_sentiment': author_mean,
-                        'review_count': len(sentiments)
+                        'review_count': sample_size
                     })
         
         # Calculate approval rate variance
-        for author, approvals in author_approval_rates.items():
-            total = sum(approvals.values())
+        for code, author in enumerate(arrays.mr_author_vocab):
+            total = int(review_counts[code])
             if total >= 3:
-                approval_rate = approvals['approved'] / total
-                change_rate = approvals['changes'] / total
-                
                 bias_indicators['approval_rate_variance'][author] = {
-                    'approval_rate': approval_rate,
-                    'change_request_rate': change_rate,
+                    'approval_rate': int(approval_counts[code, _APPROVED]) / total,
+                    'change_request_rate': int(approval_counts[code, _REQUESTED_CHANGES]) / total,
                     'total_reviews': total
                 }
         
         # Calculate overall bias score
-        if len(author_sentiments) > 1:
-            author_means = [
-                statistics.mean(sentiments) 
-                for sentiments in author_sentiments.values() 
-                if len(sentiments) >= 3
-            ]
+        if n_authors > 1:
+            author_means = means[review_counts >= 3]
             
-            if len(author_means) > 1:
+            if author_means.size > 1:
                 # High variance in mean sentiments across authors indicates potential bias
-                sentiment_variance = statistics.stdev(author_means)
+                sentiment_variance = float(author_means.std(ddof=1))
                 bias_indicators['overall_bias_score'] = min(100, sentiment_variance * 100)
         
         return bias_indicators
     
-    def calculate_temporal_trends(self, comments: List[ReviewComment]) -> Dict[str, Any]:
+    def calculate_temporal_trends(self, comments: Comments) -> Dict[str, Any]:
         """Calculate trends over time."""
         if not comments:
             return {'monthly_trends': {}, 'weekly_patterns': {}, 'daily_patterns': {}}
         
-        # Sort comments by date
-        sorted_comments = sorted(comments, key=lambda x: x.created_at)
+        if isinstance(comments, ReviewCommentFrame):
+            sentiments = comments.df['sentiment_textblob'].to_numpy(np.float64)
+            timestamps = _to_datetime_index(list(comments.df['created_at']))
+        else:
+            sentiments = np.fromiter(map(_get_sentiment, comments), dtype=np.float64, count=len(comments))
+            timestamps = _to_datetime_index(list(map(_get_created_at, comments)))
         
-        # Monthly trends
-        monthly_data = defaultdict(lambda: {'sentiments': [], 'count': 0})
-        for comment in sorted_comments:
-            month_key = comment.created_at.strftime('%Y-%m')
-            monthly_data[month_key]['sentiments'].append(comment.sentiment_textblob)
-            monthly_data[month_key]['count'] += 1
+        # Buckets are listed chronologically by their earliest comment, so the
+        # comments themselves need no sorting
+        instants = timestamps.asi8
         
+        # Monthly trends
         monthly_trends = {}
-        for month, data in monthly_data.items():
-            monthly_trends[month] = {
-                'avg_sentiment': statistics.mean(data['sentiments']),
-                'comment_count': data['count'],
-                'sentiment_std': statistics.stdev(data['sentiments']) if len(data['sentiments']) > 1 else 0
+        month_keys = (timestamps.year * 100 + timestamps.month).to_numpy()
+        for month, avg_sentiment, count, std in _bucket_statistics(month_keys, sentiments, instants):
+            monthly_trends[f'{month // 100:04d}-{month % 100:02d}'] = {
+                'avg_sentiment': avg_sentiment,
+                'comment_count': count,
+                'sentiment_std': std if count > 1 else 0
             }
         
         # Weekly patterns (day of week)
-        weekly_data = defaultdict(lambda: {'sentiments': [], 'count': 0})
-        for comment in sorted_comments:
-            day_name = comment.created_at.strftime('%A')
-            weekly_data[day_name]['sentiments'].append(comment.sentiment_textblob)
-            weekly_data[day_name]['count'] += 1
-        
         weekly_patterns = {}
-        for day, data in weekly_data.items():
-            weekly_patterns[day] = {
-                'avg_sentiment': statistics.mean(data['sentiments']),
-                'comment_count': data['count']
+        for day, avg_sentiment, count, _ in _bucket_statistics(timestamps.dayofweek.to_numpy(), sentiments, instants):
+            weekly_patterns[calendar.day_name[day]] = {
+                'avg_sentiment': avg_sentiment,
+                'comment_count': count
             }
         
         # Daily patterns (hour of day)
-        daily_data = defaultdict(lambda: {'sentiments': [], 'count': 0})
-        for comment in sorted_comments:
-            hour = comment.created_at.hour
-            daily_data[hour]['sentiments'].append(comment.sentiment_textblob)
-            daily_data[hour]['count'] += 1
-        
         daily_patterns = {}
-        for hour, data in daily_data.items():
+        for hour, avg_sentiment, count, _ in _bucket_statistics(timestamps.hour.to_numpy(), sentiments, instants):
             daily_patterns[hour] = {
-                'avg_sentiment': statistics.mean(data['sentiments']),
-                'comment_count': data['count']
+                'avg_sentiment': avg_sentiment,
+                'comment_count': count
             }
         
         return {
@@ -450,3 +730,21 @@ class MetricsCalculator:
             'weekly_patterns': weekly_patterns,
             'daily_patterns': daily_patterns
         }
+
+
+# Per-process state of the calculate_all_developer_metrics workers
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_developer_worker(mrs_data: List[Dict], index: DeveloperIndex):
+    """Receive the MRs and developer index once per worker process."""
+    _worker_state['calculator'] = MetricsCalculator()
+    _worker_state['mrs_data'] = mrs_data
+    _worker_state['index'] = index
+
+
+def _developer_metrics_worker(developer_name: str) -> DeveloperMetrics:
+    """Compute one developer's metrics in a worker process."""
+    return _worker_state['calculator']._compute_developer_metrics(
+        developer_name, _worker_state['mrs_data'], _worker_state['index']
+    )
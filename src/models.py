@@ -1,12 +1,16 @@
 """
 Data models and classes for GitLab analysis reporting.
 """
-from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+import sys
+from dataclasses import dataclass, fields
+from typing import List, Dict, Any, Optional, Iterator
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
 
-@dataclass
+
+@dataclass(slots=True)
 class DeveloperMetrics:
     """Metrics for a single developer."""
     name: str
@@ -33,7 +37,7 @@ class DeveloperMetrics:
     rejection_rate: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectMetrics:
     """Overall project metrics."""
     total_mrs: int
@@ -45,7 +49,7 @@ class ProjectMetrics:
     code_quality_score: float
     
     
-@dataclass
+@dataclass(slots=True)
 class BehaviorPattern:
     """Represents a negative behavior pattern."""
     pattern_type: str
@@ -57,7 +61,7 @@ class BehaviorPattern:
     recommendations: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class DeveloperBehaviorAnalysis:
     """Comprehensive behavior analysis for a developer."""
     developer_name: str
@@ -71,7 +75,7 @@ class DeveloperBehaviorAnalysis:
     strengths: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewComment:
     """Represents a review comment with enhanced analysis."""
     author: str
@@ -90,3 +94,53 @@ class ReviewComment:
     contains_praise: bool = False
     contains_criticism: bool = False
     word_count: int = 0
+    
+    def __post_init__(self):
+        # Statuses are compared against literals in every metrics loop; interned,
+        # equal statuses are the same object and compare by identity
+        if isinstance(self.approval_status, str):
+            self.approval_status = sys.intern(self.approval_status)
+
+
+class ReviewCommentFrame:
+    """Review comments stored column-wise in a DataFrame, one row per comment.
+    
+    Iterating yields ReviewComment objects, so list-based code keeps working,
+    while MetricsCalculator reads the columns directly.
+    """
+    
+    COLUMNS = [f.name for f in fields(ReviewComment)]
+    
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+    
+    @classmethod
+    def from_comments(cls, comments: List[ReviewComment]) -> 'ReviewCommentFrame':
+        """Build a frame from review comments."""
+        df = pd.DataFrame(
+            {name: [getattr(c, name) for c in comments] for name in cls.COLUMNS},
+            columns=cls.COLUMNS
+        )
+        df['approval_status'] = df['approval_status'].astype('category')
+        return cls(df)
+    
+    def __len__(self) -> int:
+        return len(self.df)
+    
+    def __iter__(self) -> Iterator[ReviewComment]:
+        df = self.df if list(self.df.columns) == self.COLUMNS else self.df[self.COLUMNS]
+        for values in df.itertuples(index=False, name=None):
+            yield ReviewComment(*map(_native, values))
+    
+    def to_comment(self, i: int) -> ReviewComment:
+        """Rebuild the ReviewComment at row i."""
+        return ReviewComment(*(_native(self.df[name].iat[i]) for name in self.COLUMNS))
+
+
+def _native(value: Any) -> Any:
+    """Convert a pandas or NumPy scalar read from a frame to its Python equivalent."""
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
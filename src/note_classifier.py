@@ -0,0 +1,64 @@
+"""
+Approval classification of GitLab merge request notes.
+
+This module holds the approval/request changes keywords shared by
+GitLabAnalyzer and GitLabClient, so both paths classify notes identically.
+"""
+
+import re
+import sys
+import functools
+
+
+# Distinct note bodies whose approval status is memoized
+_CLASSIFY_CACHE_SIZE = 50_000
+
+# Keywords marking a note as an approval or a change request, each compiled
+# into a single alternation so a body is scanned once per status
+_APPROVAL_KEYWORDS = [
+    'approved', 'lgtm', 'looks good', 'approve', 'ship it',
+    ':+1:', '👍', ':thumbsup:', 'ready to merge'
+]
+_CHANGES_KEYWORDS = [
+    'request changes', 'needs changes', 'please fix', 'fix this',
+    'don\'t merge', 'not ready', 'block', 'blocking', 'nack',
+    ':-1:', '👎', ':thumbsdown:'
+]
+_APPROVAL_RE = re.compile('|'.join(map(re.escape, _APPROVAL_KEYWORDS)))
+_CHANGES_RE = re.compile('|'.join(map(re.escape, _CHANGES_KEYWORDS)))
+
+# Single-word keywords, checked first against the body's words; keywords match
+# as substrings ("lgtm," or "unblock"), so the alternations remain the fallback
+_APPROVAL_TOKENS = frozenset(k for k in _APPROVAL_KEYWORDS if ' ' not in k)
+_CHANGES_TOKENS = frozenset(k for k in _CHANGES_KEYWORDS if ' ' not in k)
+
+
+@functools.lru_cache(maxsize=_CLASSIFY_CACHE_SIZE)
+def classify_note_body(body: str) -> str:
+    """Classify a note body by its approval/request changes keywords.
+    
+    The status depends on the body alone and boilerplate bodies ("LGTM",
+    ":+1:") repeat across MRs, so each distinct body is lowercased and
+    scanned once.
+    
+    Args:
+        body: Note body
+    
+    Returns:
+        String indicating approval status: 'approved', 'requested_changes'
+        or 'commented'
+    """
+    body_lower = body.lower()
+    words = body_lower.split()
+    
+    if not _APPROVAL_TOKENS.isdisjoint(words) or _APPROVAL_RE.search(body_lower):
+        return 'approved'
+    elif not _CHANGES_TOKENS.isdisjoint(words) or _CHANGES_RE.search(body_lower):
+        return 'requested_changes'
+    else:
+        return 'commented'
+
+
+def intern_name(name: str) -> str:
+    """Intern a user name; a few dozen names repeat on every comment."""
+    return sys.intern(name) if isinstance(name, str) else name
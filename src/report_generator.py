@@ -5,14 +5,92 @@ This module provides functionality to generate comprehensive HTML reports
 with visualizations and detailed analysis of reviewer behavior and bias patterns.
 """
 
+import functools
+import gzip
+import heapq
+import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from pathlib import Path
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Callable, Tuple, TextIO, Set
 
-from jinja2 import Template
+import numpy as np
+from jinja2 import (
+    ChoiceLoader, Environment, FileSystemBytecodeCache, FileSystemLoader, FunctionLoader, Template,
+    select_autoescape
+)
 
-from data_models import AnalysisResult, DeveloperTreatment, BiasAnalysis, BiasRiskLevel
+from data_models import AnalysisResult, DeveloperTreatment, BiasAnalysis, BiasRiskLevel, ReviewerStats
 from visualization import VisualizationGenerator
+from worker_pool import resolve_max_workers
+
+
+# Most toxic negative behavior instances listed in a report; the count
+# still covers every documented instance
+_MAX_NEGATIVE_INSTANCES_RENDERED = 100
+
+# Rows of long report tables rendered into the HTML; the rest are embedded
+# as JSON and appended by the page as the reader scrolls
+_TABLE_ROWS_RENDERED = 50
+
+# Write buffer for streamed reports; large reports embed several base64 images
+_WRITE_BUFFER_SIZE = 128 * 1024
+
+# Summary label and color for each overall bias risk level
+_RISK_DISPLAY = {
+    BiasRiskLevel.HIGH: ('High', '#e74c3c'),
+    BiasRiskLevel.MEDIUM: ('Medium', '#f39c12'),
+    BiasRiskLevel.LOW: ('Low', '#27ae60')
+}
+
+# Compression level for reports written to a .gz path
+_GZIP_COMPRESSLEVEL = 6
+
+_CSS_BLOCK_RE = re.compile(r'(<style>)(.*?)(</style>)', re.DOTALL)
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_CSS_WHITESPACE_RE = re.compile(r'\s+')
+_CSS_PUNCTUATION_RE = re.compile(r'\s*([{};])\s*')
+
+
+def _minify_css(template_str: str) -> str:
+    """Strip comments and redundant whitespace from a template's <style> blocks."""
+    def minify(match: re.Match) -> str:
+        css = _CSS_COMMENT_RE.sub('', match.group(2))
+        css = _CSS_WHITESPACE_RE.sub(' ', css)
+        css = _CSS_PUNCTUATION_RE.sub(r'\1', css).strip()
+        return match.group(1) + css + match.group(3)
+    
+    return _CSS_BLOCK_RE.sub(minify, template_str)
+
+
+def _open_report(output_file: str) -> TextIO:
+    """Open a report for writing, gzip-compressed when the path ends in .gz."""
+    if output_file.endswith('.gz'):
+        return gzip.open(output_file, 'wt', encoding='utf-8', compresslevel=_GZIP_COMPRESSLEVEL)
+    return open(output_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE)
+
+
+_REPORT_TEMPLATE_NAME = "report_template.html"
+
+
+def _load_builtin_template(name: str) -> Optional[str]:
+    """Source of the built-in report template, for names not found under ./templates."""
+    return _DEFAULT_TEMPLATE_STR if name == _REPORT_TEMPLATE_NAME else None
+
+
+# Templates are looked up under ./templates, then among the built-in ones;
+# compiled templates are kept in memory without reload checks and, whichever
+# loader found them, their bytecode is cached on disk across runs. HTML
+# templates autoescape their variables, so names and comment bodies render
+# as text. Bytecode cache keys ignore the environment's settings, so the
+# cache files are named apart from those compiled without autoescaping
+_ENV = Environment(
+    loader=ChoiceLoader([FileSystemLoader("templates"), FunctionLoader(_load_builtin_template)]),
+    autoescape=select_autoescape(['html', 'htm', 'xml']),
+    auto_reload=False,
+    cache_size=400,
+    bytecode_cache=FileSystemBytecodeCache(pattern='__jinja2_autoescape_%s.cache')
+)
 
 
 class ReportGenerator:
@@ -23,18 +101,22 @@ class ReportGenerator:
         self.visualization_generator = VisualizationGenerator()
     
     def generate_report(self, analysis_result: AnalysisResult, 
-                       output_file: str = "gitlab_review_analysis.html") -> str:
+                       output_file: str = "gitlab_review_analysis.html",
+                       max_workers: Optional[int] = None) -> str:
         """Generate a comprehensive HTML report.
         
         Args:
             analysis_result: Analysis result data
-            output_file: Output HTML file path
+            output_file: Output HTML file path; written gzip-compressed
+                when it ends in .gz
+            max_workers: Number of worker processes to render charts in;
+                one per CPU when omitted, and 1 renders them in this process
             
         Returns:
             Path to the generated HTML file
         """
         # Generate visualizations
-        visualizations = self._generate_visualizations(analysis_result)
+        visualizations = self._generate_visualizations(analysis_result, max_workers)
         
         # Prepare report data
         report_data = self._prepare_report_data(analysis_result, visualizations)
@@ -42,73 +124,87 @@ class ReportGenerator:
         # Get HTML template
         template = self._create_html_template()
         
-        # Render the template
-        html_content = template.render(**report_data)
-        
-        # Write to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Render the template straight to the file in chunks
+        with _open_report(output_file) as f:
+            template.stream(**report_data).dump(f)
         
         return output_file
     
-    def _generate_visualizations(self, analysis_result: AnalysisResult) -> Dict[str, str]:
+    def _generate_visualizations(self, analysis_result: AnalysisResult,
+                                 max_workers: Optional[int] = None) -> Dict[str, str]:
         """Generate visualizations for the report.
         
         Args:
             analysis_result: Analysis result data
+            max_workers: Number of worker processes to render charts in;
+                one per CPU when omitted, and 1 renders them in this process
             
         Returns:
             Dictionary mapping visualization names to base64-encoded images
         """
-        visualizations = {}
+        charts = self._visualization_tasks(analysis_result)
+        
+        # Charts are independent, but pyplot keeps global figure state and is
+        # not thread-safe, so they can only be rendered concurrently in processes
+        # Each chart takes long enough to render that any two are worth a pool
+        max_workers = resolve_max_workers(max_workers, len(charts), min_tasks=2)
+        if max_workers > 1:
+            # Constructing a generator in each worker applies the chart style
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=VisualizationGenerator) as executor:
+                futures = [(name, executor.submit(chart, *args)) for name, chart, args in charts]
+                return {name: future.result() for name, future in futures}
+        
+        return {name: chart(*args) for name, chart, args in charts}
+    
+    def _visualization_tasks(self, analysis_result: AnalysisResult) -> List[Tuple[str, Callable[..., str], Tuple]]:
+        """List the charts the report needs as (name, chart method, arguments).
+        
+        Args:
+            analysis_result: Analysis result data
+            
+        Returns:
+            Chart tasks in the order their visualizations appear
+        """
+        generator = self.visualization_generator
+        charts = []
         
         # Only generate visualizations if we have developer treatment data
         if analysis_result.developer_treatment:
-            # Sentiment comparison across team members
-            visualizations['sentiment_comparison'] = self.visualization_generator.generate_sentiment_comparison_chart(
-                analysis_result.developer_treatment
-            )
-            
-            # Team interaction heatmap
-            visualizations['team_interaction'] = self.visualization_generator.generate_team_interaction_heatmap(
-                analysis_result.developer_treatment
-            )
-            
-            # Bias risk distribution
-            visualizations['bias_risk'] = self.visualization_generator.generate_bias_risk_chart(
-                analysis_result.developer_treatment
-            )
-            
-            # Negative behavior patterns
-            visualizations['negative_patterns'] = self.visualization_generator.generate_comparative_behavior_chart(
-                analysis_result.developer_treatment
-            )
+            treatments = (analysis_result.developer_treatment,)
+            charts += [
+                # Sentiment comparison across team members
+                ('sentiment_comparison', generator.generate_sentiment_comparison_chart, treatments),
+                # Team interaction heatmap
+                ('team_interaction', generator.generate_team_interaction_heatmap, treatments),
+                # Bias risk distribution
+                ('bias_risk', generator.generate_bias_risk_chart, treatments),
+                # Negative behavior patterns
+                ('negative_patterns', generator.generate_comparative_behavior_chart, treatments)
+            ]
         
         # Sentiment timeline (if we have comments)
         if analysis_result.all_comments:
-            visualizations['sentiment_timeline'] = self.visualization_generator.generate_sentiment_timeline(
-                analysis_result.all_comments
-            )
+            charts.append(('sentiment_timeline', generator.generate_sentiment_timeline,
+                           (analysis_result.all_comments,)))
         
         # If we have a specific reviewer, generate reviewer-specific visualizations
         if analysis_result.reviewer_stats and analysis_result.reviewer_comments:
             reviewer_name = analysis_result.reviewer_stats.reviewer_name
             
             # Reviewer sentiment timeline
-            visualizations['reviewer_timeline'] = self.visualization_generator.generate_sentiment_timeline(
-                analysis_result.reviewer_comments, reviewer_name
-            )
+            charts.append(('reviewer_timeline', generator.generate_sentiment_timeline,
+                           (analysis_result.reviewer_comments, reviewer_name)))
             
             # If we have developer treatment data for this reviewer
             for developer, treatment in analysis_result.developer_treatment.items():
                 if reviewer_name in treatment.reviewer_stats:
                     # Generate reviewer behavior chart for this developer
-                    visualizations[f'reviewer_behavior_{developer}'] = self.visualization_generator.generate_reviewer_behavior_chart(
-                        developer, treatment.reviewer_stats
-                    )
+                    charts.append((f'reviewer_behavior_{developer}', generator.generate_reviewer_behavior_chart,
+                                   (developer, treatment.reviewer_stats)))
                     break
         
-        return visualizations
+        return charts
     
     def _prepare_report_data(self, analysis_result: AnalysisResult, 
                            visualizations: Dict[str, str]) -> Dict[str, Any]:
@@ -121,6 +217,8 @@ class ReportGenerator:
         Returns:
             Dictionary with data for the report template
         """
+        developer_rows, recommendations, negative_behavior = self._aggregate_treatments(analysis_result)
+        
         # Basic report data
         report_data = {
             'generated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -130,6 +228,9 @@ class ReportGenerator:
             'reviewer_stats': analysis_result.reviewer_stats,
             'team_stats': analysis_result.team_stats,
             'developer_treatments': analysis_result.developer_treatment,
+            'developer_rows': developer_rows,
+            'author_rows': self._author_rows(analysis_result.reviewer_stats),
+            'rows_rendered': _TABLE_ROWS_RENDERED,
             'bias_analysis': analysis_result.bias_analysis,
             'has_team_analysis': bool(analysis_result.developer_treatment),
             'has_reviewer_analysis': bool(analysis_result.reviewer_stats),
@@ -137,21 +238,86 @@ class ReportGenerator:
         }
         
         # Prepare summary data
-        summary = self._prepare_summary(analysis_result)
+        summary = self._prepare_summary(analysis_result.reviewer_stats, analysis_result.bias_analysis,
+                                        recommendations)
         report_data['summary'] = summary
         
-        # Prepare negative behavior documentation
-        negative_behavior = self._document_negative_behavior(analysis_result)
+        # Negative behavior documentation
         report_data['negative_behavior'] = negative_behavior
         
         return report_data
     
-    def _prepare_summary(self, analysis_result: AnalysisResult) -> Dict[str, Any]:
-        """Prepare summary data for the report.
+    def _aggregate_treatments(self, analysis_result: AnalysisResult
+                              ) -> Tuple[List[Dict[str, Any]], Set[str], Dict[str, Any]]:
+        """Collect everything the report reads from developer treatments in one pass.
+        
+        Each treatment is flattened into a plain row for the template, whose
+        dict items Jinja looks up directly rather than through getattr.
         
         Args:
             analysis_result: Analysis result data
             
+        Returns:
+            Tuple of the developer rows in treatment order, the unique treatment
+            recommendations and the negative behavior documentation
+        """
+        developer_rows = []
+        recommendations = set()
+        negative_reviews = []
+        
+        for developer, treatment in analysis_result.developer_treatment.items():
+            developer_rows.append({
+                'name': developer,
+                'overall_sentiment': treatment.overall_sentiment,
+                'overall_sentiment_str': f"{treatment.overall_sentiment:.3f}",
+                'total_reviews': treatment.total_reviews,
+                'total_negative_reviews': treatment.total_negative_reviews,
+                'bias_risk_value': treatment.bias_risk.value,
+                'bias_indicators': list(treatment.bias_indicators)
+            })
+            recommendations.update(treatment.recommendations)
+            
+            for reviewer, stats in treatment.reviewer_stats.items():
+                negative_comments = stats.get('negative_comments')
+                if negative_comments:
+                    negative_reviews.append((reviewer, developer, negative_comments))
+        
+        return developer_rows, recommendations, self._document_negative_behavior(negative_reviews)
+    
+    @staticmethod
+    def _author_rows(reviewer_stats: Optional[ReviewerStats]) -> List[Dict[str, Any]]:
+        """Flatten the reviewer's per-author sentiments into table rows with formatted averages.
+        
+        Args:
+            reviewer_stats: Statistics of the analyzed reviewer, if any
+            
+        Returns:
+            One dictionary per reviewed author
+        """
+        if reviewer_stats is None:
+            return []
+        
+        rows = []
+        for author, sentiments in reviewer_stats.sentiment_by_author.items():
+            avg_sentiment = sum(sentiments) / len(sentiments)
+            rows.append({
+                'name': author,
+                'count': len(sentiments),
+                'avg_sentiment': avg_sentiment,
+                'avg_sentiment_str': f"{avg_sentiment:.3f}"
+            })
+        return rows
+    
+    @staticmethod
+    def _prepare_summary(reviewer_stats: Optional[ReviewerStats], bias_analysis: Optional[BiasAnalysis],
+                         treatment_recommendations: Set[str]) -> Dict[str, Any]:
+        """Prepare summary data for the report.
+        
+        Args:
+            reviewer_stats: Statistics of the analyzed reviewer, if any
+            bias_analysis: Team bias analysis, if any
+            treatment_recommendations: Unique recommendations across developer treatments
+            
         Returns:
             Dictionary with summary data
         """
@@ -167,8 +333,7 @@ class ReportGenerator:
         }
         
         # Add reviewer-specific summary if available
-        if analysis_result.reviewer_stats:
-            reviewer_stats = analysis_result.reviewer_stats
+        if reviewer_stats is not None:
             summary['total_reviews'] = reviewer_stats.total_reviews
             summary['avg_sentiment'] = reviewer_stats.avg_sentiment_textblob
             
@@ -181,35 +346,33 @@ class ReportGenerator:
             
             # Check for sentiment variation
             if reviewer_stats.sentiment_by_author:
-                sentiments = [sum(s)/len(s) for s in reviewer_stats.sentiment_by_author.values()]
-                sentiment_range = max(sentiments) - min(sentiments) if sentiments else 0
+                # Average each author's sentiments once; the range and the most
+                # negative author are both read from these means
+                authors = list(reviewer_stats.sentiment_by_author)
+                sentiments = np.fromiter(
+                    (sum(s) / len(s) for s in reviewer_stats.sentiment_by_author.values()),
+                    dtype=np.float64, count=len(authors)
+                )
+                sentiment_range = float(sentiments.max() - sentiments.min())
                 
                 if sentiment_range > 0.4:
                     summary['key_findings'].append(f"High sentiment variation between authors ({sentiment_range:.2f})")
                     
                     # Find most negative sentiment
-                    most_negative_author = min(
-                        reviewer_stats.sentiment_by_author.items(),
-                        key=lambda x: sum(x[1]) / len(x[1])
-                    )
-                    avg_negative = sum(most_negative_author[1]) / len(most_negative_author[1])
+                    most_negative = int(sentiments.argmin())
+                    avg_negative = float(sentiments[most_negative])
                     
                     if avg_negative < -0.2:
                         summary['key_findings'].append(
-                            f"Potentially negative sentiment towards {most_negative_author[0]} ({avg_negative:.2f})"
+                            f"Potentially negative sentiment towards {authors[most_negative]} ({avg_negative:.2f})"
                         )
         
         # Add team-wide summary if available
-        if analysis_result.bias_analysis:
-            bias_analysis = analysis_result.bias_analysis
-            
+        if bias_analysis is not None:
             # Set bias risk level
-            if bias_analysis.overall_risk == BiasRiskLevel.HIGH:
-                summary['bias_risk_level'] = 'High'
-                summary['bias_risk_color'] = '#e74c3c'
-            elif bias_analysis.overall_risk == BiasRiskLevel.MEDIUM:
-                summary['bias_risk_level'] = 'Medium'
-                summary['bias_risk_color'] = '#f39c12'
+            summary['bias_risk_level'], summary['bias_risk_color'] = _RISK_DISPLAY.get(
+                bias_analysis.overall_risk, _RISK_DISPLAY[BiasRiskLevel.LOW]
+            )
             
             # Add specific risks to key findings
             for risk in bias_analysis.specific_risks:
@@ -218,17 +381,10 @@ class ReportGenerator:
             # Add mitigation strategies to recommendations
             summary['recommendations'].extend(bias_analysis.mitigation_strategies)
         
-        # Add developer treatment recommendations if available
-        if analysis_result.developer_treatment:
-            # Collect all unique recommendations
-            all_recommendations = set()
-            for treatment in analysis_result.developer_treatment.values():
-                all_recommendations.update(treatment.recommendations)
-            
-            # Add to summary recommendations (excluding generic ones)
-            for rec in all_recommendations:
-                if "appears fair and balanced" not in rec:
-                    summary['recommendations'].append(rec)
+        # Add developer treatment recommendations (excluding generic ones)
+        for rec in treatment_recommendations:
+            if "appears fair and balanced" not in rec:
+                summary['recommendations'].append(rec)
         
         # If no key findings, add a positive note
         if not summary['key_findings']:
@@ -240,77 +396,85 @@ class ReportGenerator:
         
         return summary
     
-    def _document_negative_behavior(self, analysis_result: AnalysisResult) -> Dict[str, Any]:
+    @staticmethod
+    def _document_negative_behavior(negative_reviews: List[Tuple[str, str, List[Dict[str, Any]]]]
+                                    ) -> Dict[str, Any]:
         """Document instances of negative behavior.
         
         Args:
-            analysis_result: Analysis result data
+            negative_reviews: (reviewer, target developer, negative comment
+                instances) for each reviewer with negative comments
             
         Returns:
             Dictionary with negative behavior documentation
         """
-        documentation = {
-            'instances': [],
-            'reviewers': set(),
-            'targets': set(),
-            'categories': set(),
-            'count': 0
-        }
+        # Dicts serve as ordered sets: names are listed in order of first appearance
+        instances = []
+        reviewers = {}
+        targets = {}
+        categories = {}
         
         # Collect negative behavior instances from developer treatments
-        if analysis_result.developer_treatment:
-            for developer, treatment in analysis_result.developer_treatment.items():
-                for reviewer, stats in treatment.reviewer_stats.items():
-                    if 'negative_comments' in stats:
-                        for instance in stats['negative_comments']:
-                            # Add to documentation
-                            documentation['instances'].append({
-                                'reviewer': reviewer,
-                                'target': developer,
-                                'comment': instance['comment'].body,
-                                'mr_title': instance['comment'].mr_title,
-                                'created_at': instance['comment'].created_at.strftime("%Y-%m-%d"),
-                                'sentiment': instance['comment'].sentiment.textblob_score,
-                                'categories': instance['categories'],
-                                'severity': instance['severity'],
-                                'toxicity_score': instance['toxicity_score'],
-                                'constructiveness_score': instance['constructiveness_score']
-                            })
-                            
-                            # Update metadata
-                            documentation['reviewers'].add(reviewer)
-                            documentation['targets'].add(developer)
-                            documentation['categories'].update(instance['categories'])
-        
-        # Convert sets to lists for JSON serialization
-        documentation['reviewers'] = list(documentation['reviewers'])
-        documentation['targets'] = list(documentation['targets'])
-        documentation['categories'] = list(documentation['categories'])
-        documentation['count'] = len(documentation['instances'])
-        
-        # Sort instances by toxicity score (most toxic first)
-        documentation['instances'] = sorted(
-            documentation['instances'], 
-            key=lambda x: x['toxicity_score'], 
-            reverse=True
+        for reviewer, developer, negative_comments in negative_reviews:
+            for instance in negative_comments:
+                comment = instance['comment']
+                instance_categories = instance['categories']
+                instances.append({
+                    'reviewer': reviewer,
+                    'target': developer,
+                    'comment': comment.body,
+                    'mr_title': comment.mr_title,
+                    'created_at': comment.created_at.date().isoformat(),
+                    'sentiment': comment.sentiment.textblob_score,
+                    'categories': instance_categories,
+                    'severity': instance['severity'],
+                    'toxicity_score': instance['toxicity_score'],
+                    'constructiveness_score': instance['constructiveness_score']
+                })
+                categories.update(dict.fromkeys(instance_categories))
+            
+            # Update metadata
+            reviewers[reviewer] = None
+            targets[developer] = None
+        
+        # Keep the most toxic instances, most toxic first, and format the
+        # scores shown for them
+        top_instances = heapq.nlargest(
+            _MAX_NEGATIVE_INSTANCES_RENDERED, instances, key=itemgetter('toxicity_score')
         )
+        for instance in top_instances:
+            instance['sentiment_str'] = f"{instance['sentiment']:.2f}"
+            instance['toxicity_str'] = f"{instance['toxicity_score']:.2f}"
+        
+        # Convert to lists for JSON serialization
+        documentation = {
+            'instances': top_instances,
+            'reviewers': list(reviewers),
+            'targets': list(targets),
+            'categories': list(categories),
+            'count': len(instances)
+        }
         
         return documentation
     
-    def _create_html_template(self) -> Template:
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _create_html_template(cls) -> Template:
         """Create the HTML template for the report.
         
+        The template is compiled once per process and shared by every report
+        rendered afterwards.
+        
         Returns:
             Jinja2 Template object
         """
-        # Load template from file if it exists, otherwise use a simple template
-        template_path = Path("templates/report_template.html")
-        if template_path.exists():
-            with open(template_path, "r", encoding="utf-8") as f:
-                return Template(f.read())
-        
-        # Advanced template with better styling
-        template_str = """
+        # Load template from file if it exists, otherwise use the built-in one
+        return _ENV.get_template(_REPORT_TEMPLATE_NAME)
+
+
+# Built-in report template with advanced styling, used when
+# templates/report_template.html is absent; its CSS is minified once at import
+_DEFAULT_TEMPLATE_STR = _minify_css("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -786,19 +950,19 @@ class ReportGenerator:
                 <div class="findings-container">
                     <h3>Developer Treatment Summary</h3>
                     
-                    {% for developer, treatment in developer_treatments.items() %}
+                    {% for row in developer_rows %}
                     <div style="margin: 1rem 0; padding: 1rem; background: white; border-radius: 8px; box-shadow: 0 2px 5px rgba(0,0,0,0.05);">
-                        <h4>{{ developer }}</h4>
-                        <p><strong>Overall Sentiment:</strong> {{ "%.3f"|format(treatment.overall_sentiment) }}</p>
-                        <p><strong>Total Reviews:</strong> {{ treatment.total_reviews }}</p>
-                        <p><strong>Negative Reviews:</strong> {{ treatment.total_negative_reviews }}</p>
-                        <p><strong>Bias Risk:</strong> {{ treatment.bias_risk.value }}</p>
+                        <h4>{{ row['name'] }}</h4>
+                        <p><strong>Overall Sentiment:</strong> {{ row['overall_sentiment_str'] }}</p>
+                        <p><strong>Total Reviews:</strong> {{ row['total_reviews'] }}</p>
+                        <p><strong>Negative Reviews:</strong> {{ row['total_negative_reviews'] }}</p>
+                        <p><strong>Bias Risk:</strong> {{ row['bias_risk_value'] }}</p>
                         
-                        {% if treatment.bias_indicators %}
+                        {% if row['bias_indicators'] %}
                         <div style="margin-top: 0.5rem;">
                             <strong>Bias Indicators:</strong>
                             <ul style="margin: 0.5rem 0; padding-left: 1.5rem;">
-                                {% for indicator in treatment.bias_indicators %}
+                                {% for indicator in row['bias_indicators'] %}
                                 <li>{{ indicator }}</li>
                                 {% endfor %}
                             </ul>
@@ -857,16 +1021,20 @@ class ReportGenerator:
                                     <th style="padding: 0.5rem;">Avg Sentiment</th>
                                 </tr>
                             </thead>
-                            <tbody>
-                                {% for author, stats in reviewer_stats.sentiment_by_author.items() %}
+                            <tbody id="authors-body">
+                                {% for row in author_rows[:rows_rendered] %}
                                 <tr style="border-bottom: 1px solid #eee;">
-                                    <td style="padding: 0.5rem;">{{ author }}</td>
-                                    <td style="padding: 0.5rem;">{{ stats.count }}</td>
-                                    <td style="padding: 0.5rem;">{{ "%.3f"|format(stats.avg_sentiment) }}</td>
+                                    <td style="padding: 0.5rem;">{{ row['name'] }}</td>
+                                    <td style="padding: 0.5rem;">{{ row['count'] }}</td>
+                                    <td style="padding: 0.5rem;">{{ row['avg_sentiment_str'] }}</td>
                                 </tr>
                                 {% endfor %}
                             </tbody>
                         </table>
+                        {% if author_rows|length > rows_rendered %}
+                        <script type="application/json" id="authors-data">{{ author_rows[rows_rendered:] | tojson }}</script>
+                        <div class="lazy-rows" data-source="authors-data" data-target="authors-body" data-kind="author"></div>
+                        {% endif %}
                     </div>
                     {% endif %}
                 </div>
@@ -879,7 +1047,8 @@ class ReportGenerator:
                 <h2>Negative Behavior Documentation</h2>
                 <p>Documented Instances: {{ negative_behavior.count }}</p>
                 
-                {% for instance in negative_behavior.instances %}
+                <div id="behavior-list">
+                {% for instance in negative_behavior.instances[:rows_rendered] %}
                 <div class="behavior-instance {{ instance.severity }}">
                     <div class="behavior-meta">
                         <span><strong>Reviewer:</strong> {{ instance.reviewer }}</span>
@@ -889,11 +1058,16 @@ class ReportGenerator:
                         <p>"{{ instance.comment }}"</p>
                     </div>
                     <div class="behavior-scores">
-                        <span class="behavior-score">Sentiment: {{ "%.2f"|format(instance.sentiment) }}</span>
-                        <span class="behavior-score">Toxicity: {{ "%.2f"|format(instance.toxicity_score) }}</span>
+                        <span class="behavior-score">Sentiment: {{ instance['sentiment_str'] }}</span>
+                        <span class="behavior-score">Toxicity: {{ instance['toxicity_str'] }}</span>
                     </div>
                 </div>
                 {% endfor %}
+                </div>
+                {% if negative_behavior.instances|length > rows_rendered %}
+                <script type="application/json" id="behavior-data">{{ negative_behavior.instances[rows_rendered:] | tojson }}</script>
+                <div class="lazy-rows" data-source="behavior-data" data-target="behavior-list" data-kind="behavior"></div>
+                {% endif %}
             </section>
             {% endif %}
             
@@ -948,9 +1122,82 @@ class ReportGenerator:
             buttons.forEach(button => button.classList.remove('active'));
             event.currentTarget.classList.add('active');
         }
+        
+        // Rows of long tables past the server-rendered ones are embedded as
+        // JSON and appended a page at a time as the end of the table
+        // scrolls into view
+        const LAZY_PAGE_SIZE = 50;
+        
+        function textElement(tag, text, className) {
+            const el = document.createElement(tag);
+            el.textContent = text;
+            if (className) el.className = className;
+            return el;
+        }
+        
+        function labeled(label, text) {
+            const span = document.createElement('span');
+            span.appendChild(textElement('strong', label));
+            span.appendChild(document.createTextNode(' ' + text));
+            return span;
+        }
+        
+        const lazyRowBuilders = {
+            author(row) {
+                const tr = document.createElement('tr');
+                tr.style.borderBottom = '1px solid #eee';
+                for (const value of [row.name, row.count, row.avg_sentiment_str]) {
+                    const td = textElement('td', value);
+                    td.style.padding = '0.5rem';
+                    tr.appendChild(td);
+                }
+                return tr;
+            },
+            behavior(instance) {
+                const div = document.createElement('div');
+                div.className = 'behavior-instance ' + instance.severity;
+                const meta = div.appendChild(document.createElement('div'));
+                meta.className = 'behavior-meta';
+                meta.appendChild(labeled('Reviewer:', instance.reviewer));
+                meta.appendChild(labeled('Target:', instance.target));
+                const comment = div.appendChild(document.createElement('div'));
+                comment.className = 'behavior-comment';
+                comment.appendChild(textElement('p', '"' + instance.comment + '"'));
+                const scores = div.appendChild(document.createElement('div'));
+                scores.className = 'behavior-scores';
+                scores.appendChild(textElement('span', 'Sentiment: ' + instance.sentiment_str, 'behavior-score'));
+                scores.appendChild(textElement('span', 'Toxicity: ' + instance.toxicity_str, 'behavior-score'));
+                return div;
+            }
+        };
+        
+        document.querySelectorAll('.lazy-rows').forEach(sentinel => {
+            const rows = JSON.parse(document.getElementById(sentinel.dataset.source).textContent);
+            const target = document.getElementById(sentinel.dataset.target);
+            const build = lazyRowBuilders[sentinel.dataset.kind];
+            let next = 0;
+            
+            // Appends the next page of rows; false once every row is shown
+            function appendPage() {
+                const page = document.createDocumentFragment();
+                const end = Math.min(next + LAZY_PAGE_SIZE, rows.length);
+                for (; next < end; next++) page.appendChild(build(rows[next]));
+                target.appendChild(page);
+                return next < rows.length;
+            }
+            
+            if (!('IntersectionObserver' in window)) {
+                while (appendPage());
+                return;
+            }
+            const observer = new IntersectionObserver(entries => {
+                if (entries.some(entry => entry.isIntersecting) && !appendPage()) {
+                    observer.disconnect();
+                }
+            }, {rootMargin: '200px'});
+            observer.observe(sentinel);
+        });
     </script>
 </body>
 </html>
-"""
-        
-        return Template(template_str)
+""")
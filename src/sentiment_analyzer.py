@@ -5,15 +5,110 @@ This module provides sentiment analysis capabilities using multiple algorithms,
 including TextBlob and VADER, with the ability to extend to additional methods.
 """
 
+import asyncio
+import functools
+import json
+import re
 from typing import Dict, Tuple, List, Any, Optional
 from abc import ABC, abstractmethod
 
-from textblob import TextBlob
+import numpy as np
+from textblob.en.sentiments import PatternAnalyzer
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 from data_models import SentimentScore
 
 
+# Number of distinct texts whose sentiment is memoized per algorithm
+_SENTIMENT_CACHE_SIZE = 50_000
+
+# JSON-like content between the outermost curly braces of an LLM response
+_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Sentiment requests kept in flight at once by LLMAnalyzer.analyze_batch
+_LLM_CONCURRENCY = 8
+
+# VADER 3.3.x slows down quadratically on emoji-heavy text (one emoji-spam
+# note can take minutes): bodies with many emoticons are scored neutral and
+# long bodies are truncated before they reach it
+_EMOTICON_RE = re.compile(r'[:;]-?[()DPp]|[\u2600-\u27BF\U0001F300-\U0001FAFF]')
+_VADER_MAX_EMOTICONS = 50
+_VADER_MAX_CHARS = 4000
+_VADER_TRUNCATED_CHARS = 2000
+_NEUTRAL_VADER_SCORES = (('neg', 0.0), ('neu', 1.0), ('pos', 0.0), ('compound', 0.0))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_vader() -> SentimentIntensityAnalyzer:
+    """Shared VADER analyzer, so its lexicon files are read and parsed once per process.
+    
+    polarity_scores only reads the lexicon, so one instance serves every
+    VaderAnalyzer.
+    """
+    return SentimentIntensityAnalyzer()
+
+
+def bounded_polarity_scores(vader: SentimentIntensityAnalyzer, text: str) -> Dict[str, float]:
+    """Score text with VADER, guarding against its slowdown on emoji-heavy input.
+    
+    Text with more than _VADER_MAX_EMOTICONS emoticons or emoji is scored
+    neutral and text longer than _VADER_MAX_CHARS is scored on its first
+    _VADER_TRUNCATED_CHARS characters; all other text is scored as is.
+    
+    Args:
+        vader: VADER analyzer
+        text: Text to analyze
+        
+    Returns:
+        Dictionary with VADER scores
+    """
+    if len(_EMOTICON_RE.findall(text)) > _VADER_MAX_EMOTICONS:
+        return dict(_NEUTRAL_VADER_SCORES)
+    if len(text) > _VADER_MAX_CHARS:
+        text = text[:_VADER_TRUNCATED_CHARS]
+    return vader.polarity_scores(text)
+
+
+def in_event_loop() -> bool:
+    """Whether the calling thread is running an asyncio event loop.
+    
+    asyncio.run cannot start a loop inside a running one (e.g. in a
+    notebook), so concurrent LLM requests fall back to sequential ones.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def _get_pattern_analyzer() -> PatternAnalyzer:
+    """Shared TextBlob pattern analyzer."""
+    return PatternAnalyzer()
+
+
+@functools.lru_cache(maxsize=_SENTIMENT_CACHE_SIZE)
+def _textblob_polarity(text: str) -> float:
+    """TextBlob polarity of text.
+    
+    Memoized per text, as are VADER scores: boilerplate comments ("LGTM",
+    ":+1:") repeat across MRs and both algorithms are deterministic.
+    TextBlob's default sentiment analyzer is called directly: only the
+    polarity is used, so no TextBlob object needs to be built per text.
+    """
+    return _get_pattern_analyzer().analyze(text).polarity
+
+
+@functools.lru_cache(maxsize=_SENTIMENT_CACHE_SIZE)
+def _vader_score_items(text: str) -> Tuple[Tuple[str, float], ...]:
+    """VADER scores of text as (score name, value) pairs.
+    
+    Cached as immutable items so callers never share a mutable dict.
+    """
+    return tuple(bounded_polarity_scores(_get_vader(), text).items())
+
+
 class SentimentAnalyzer:
     """Main sentiment analyzer that combines multiple algorithms."""
     
@@ -42,6 +137,18 @@ class SentimentAnalyzer:
         
         return textblob_sentiment, vader_scores
     
+    def analyze_batch(self, texts: List[str]) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Analyze sentiment of many texts in one pass per method.
+        
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            Tuple of (TextBlob polarities, VADER score arrays by score name),
+            each array aligned with texts
+        """
+        return self.analyzers[0].analyze_batch(texts), self.analyzers[1].analyze_batch(texts)
+    
     def create_sentiment_score(self, text: str) -> SentimentScore:
         """Create a comprehensive SentimentScore object for the text.
         
@@ -112,8 +219,18 @@ class TextBlobAnalyzer(SentimentAlgorithm):
         Returns:
             Polarity score (-1 to 1)
         """
-        blob = TextBlob(text)
-        return blob.sentiment.polarity
+        return _textblob_polarity(text)
+    
+    def analyze_batch(self, texts: List[str]) -> np.ndarray:
+        """Analyze sentiment of many texts using TextBlob.
+        
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            Array of polarity scores (-1 to 1), aligned with texts
+        """
+        return np.fromiter(map(_textblob_polarity, texts), dtype=np.float64, count=len(texts))
 
 
 class VaderAnalyzer(SentimentAlgorithm):
@@ -121,7 +238,7 @@ class VaderAnalyzer(SentimentAlgorithm):
     
     def __init__(self):
         """Initialize the VADER analyzer."""
-        self.vader = SentimentIntensityAnalyzer()
+        self.vader = _get_vader()
     
     def analyze(self, text: str) -> Dict[str, float]:
         """Analyze sentiment using VADER.
@@ -132,7 +249,32 @@ class VaderAnalyzer(SentimentAlgorithm):
         Returns:
             Dictionary with VADER scores
         """
-        return self.vader.polarity_scores(text)
+        return dict(_vader_score_items(text))
+    
+    def analyze_batch(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        """Analyze sentiment of many texts using VADER.
+        
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            Dictionary of score arrays ('compound', 'pos', 'neu', 'neg'),
+            each aligned with texts
+        """
+        n = len(texts)
+        compound = np.empty(n)
+        pos = np.empty(n)
+        neu = np.empty(n)
+        neg = np.empty(n)
+        
+        for i, text in enumerate(texts):
+            scores = dict(_vader_score_items(text))
+            compound[i] = scores['compound']
+            pos[i] = scores['pos']
+            neu[i] = scores['neu']
+            neg[i] = scores['neg']
+        
+        return {'compound': compound, 'pos': pos, 'neu': neu, 'neg': neg}
 
 
 class LLMAnalyzer(SentimentAlgorithm):
@@ -152,6 +294,8 @@ class LLMAnalyzer(SentimentAlgorithm):
         try:
             import ollama
             self.ollama = ollama
+            # One client for every request, so its HTTP connection is reused
+            self.client = ollama.Client(host=host)
             self.available = True
         except ImportError:
             self.available = False
@@ -166,53 +310,134 @@ class LLMAnalyzer(SentimentAlgorithm):
             Dictionary with sentiment scores
         """
         if not self.available:
-            return {'compound': 0.0, 'pos': 0.0, 'neu': 1.0, 'neg': 0.0}
+            return self._neutral_scores()
         
         try:
-            # Simple prompt for sentiment score
-            prompt = f"""
-            Analyze this text for sentiment on a scale from -1 (very negative) to 1 (very positive):
-            
-            "{text}"
-            
-            Return only a number between -1 and 1.
-            """
-            
-            response = self.ollama.chat(
+            response = self.client.chat(
                 model=self.model,
-                messages=[{'role': 'user', 'content': prompt}]
+                messages=[{'role': 'user', 'content': self._sentiment_prompt(text)}]
             )
+            return self._scores_from_response(response)
+        except Exception:
+            # Return neutral sentiment on error
+            return self._neutral_scores()
+    
+    def analyze_batch(self, texts: List[str], concurrency: int = _LLM_CONCURRENCY) -> Dict[str, np.ndarray]:
+        """Analyze sentiment of many texts using LLM.
+        
+        Generations are I/O-bound on the model server, so up to concurrency
+        requests are kept in flight over one client instead of sending them
+        one at a time.
+        
+        Args:
+            texts: Texts to analyze
+            concurrency: Maximum number of concurrent requests
             
-            # Try to extract a number from the response
-            content = response['message']['content'].strip()
+        Returns:
+            Dictionary of score arrays ('compound', 'pos', 'neu', 'neg'),
+            each aligned with texts
+        """
+        if not (self.available and texts):
+            results = [self._neutral_scores() for _ in texts]
+        elif in_event_loop():
+            # asyncio.run cannot start a loop inside a running one (e.g. a
+            # notebook), so send the requests one at a time instead
+            results = [self.analyze(text) for text in texts]
+        else:
+            results = asyncio.run(self._analyze_concurrently(texts, concurrency))
+        
+        return {
+            key: np.fromiter((scores[key] for scores in results), dtype=np.float64, count=len(texts))
+            for key in ('compound', 'pos', 'neu', 'neg')
+        }
+    
+    async def _analyze_concurrently(self, texts: List[str], concurrency: int) -> List[Dict[str, float]]:
+        """Send sentiment prompts to Ollama concurrently over a single client.
+        
+        Args:
+            texts: Texts to analyze
+            concurrency: Maximum number of concurrent requests
+            
+        Returns:
+            Sentiment scores, aligned with texts
+        """
+        # An async client is bound to the event loop it runs on, so each
+        # batch opens its own
+        client = self.ollama.AsyncClient(host=self.host)
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def analyze_one(text: str) -> Dict[str, float]:
             try:
-                score = float(content)
-                # Ensure it's in the range [-1, 1]
-                score = max(-1.0, min(1.0, score))
-            except ValueError:
-                # Default to neutral if we can't parse a number
-                score = 0.0
+                async with semaphore:
+                    response = await client.chat(
+                        model=self.model,
+                        messages=[{'role': 'user', 'content': self._sentiment_prompt(text)}]
+                    )
+                return self._scores_from_response(response)
+            except Exception:
+                # Return neutral sentiment on error
+                return self._neutral_scores()
+        
+        try:
+            return await asyncio.gather(*map(analyze_one, texts))
+        finally:
+            # ollama's AsyncClient has no close method; close the httpx
+            # client it wraps so the batch's connections are released
+            await client._client.aclose()
+    
+    @staticmethod
+    def _sentiment_prompt(text: str) -> str:
+        """Build the prompt asking for a single sentiment score."""
+        # Simple prompt for sentiment score
+        return f"""
+            Analyze this text for sentiment on a scale from -1 (very negative) to 1 (very positive):
             
-            # Convert to VADER-like format for compatibility
-            if score > 0:
-                pos = score
-                neg = 0.0
-                neu = 1.0 - pos
-            else:
-                neg = abs(score)
-                pos = 0.0
-                neu = 1.0 - neg
+            "{text}"
             
-            return {
-                'compound': score,
-                'pos': pos,
-                'neu': neu,
-                'neg': neg
-            }
+            Return only a number between -1 and 1.
+            """
+    
+    @staticmethod
+    def _scores_from_response(response: Any) -> Dict[str, float]:
+        """Convert a sentiment score response to VADER-like scores.
+        
+        Args:
+            response: Ollama chat response
             
-        except Exception:
-            # Return neutral sentiment on error
-            return {'compound': 0.0, 'pos': 0.0, 'neu': 1.0, 'neg': 0.0}
+        Returns:
+            Dictionary with sentiment scores
+        """
+        # Try to extract a number from the response
+        content = response['message']['content'].strip()
+        try:
+            score = float(content)
+            # Ensure it's in the range [-1, 1]
+            score = max(-1.0, min(1.0, score))
+        except ValueError:
+            # Default to neutral if we can't parse a number
+            score = 0.0
+        
+        # Convert to VADER-like format for compatibility
+        if score > 0:
+            pos = score
+            neg = 0.0
+            neu = 1.0 - pos
+        else:
+            neg = abs(score)
+            pos = 0.0
+            neu = 1.0 - neg
+        
+        return {
+            'compound': score,
+            'pos': pos,
+            'neu': neu,
+            'neg': neg
+        }
+    
+    @staticmethod
+    def _neutral_scores() -> Dict[str, float]:
+        """Scores reported when the LLM is unavailable or fails."""
+        return {'compound': 0.0, 'pos': 0.0, 'neu': 1.0, 'neg': 0.0}
     
     def analyze_detailed(self, text: str) -> Dict[str, Any]:
         """Perform detailed analysis of text using LLM.
@@ -248,7 +473,7 @@ class LLMAnalyzer(SentimentAlgorithm):
             Return ONLY the JSON object, nothing else.
             """
             
-            response = self.ollama.chat(
+            response = self.client.chat(
                 model=self.model,
                 messages=[{'role': 'user', 'content': prompt}]
             )
@@ -256,11 +481,9 @@ class LLMAnalyzer(SentimentAlgorithm):
             content = response['message']['content']
             
             # Try to parse JSON from the response
-            import json
             try:
                 # Find JSON-like content between curly braces
-                import re
-                json_match = re.search(r'\{.*\}', content, re.DOTALL)
+                json_match = _JSON_RE.search(content)
                 if json_match:
                     json_str = json_match.group(0)
                     result = json.loads(json_str)
@@ -6,7 +6,6 @@ to compare bias patterns across team members and illustrate review behavior.
 """
 
 import os
-import base64
 from io import BytesIO
 from typing import Dict, List, Any, Optional, Tuple
 
@@ -17,6 +16,12 @@ import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
 import seaborn as sns
 
+try:
+    # SIMD-accelerated, drop-in compatible encoder when installed
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 from data_models import ReviewComment, DeveloperTreatment, BiasRiskLevel
 
 
@@ -409,8 +414,7 @@ class VisualizationGenerator:
         buf = BytesIO()
         fig.savefig(buf, format='png', dpi=100)
         plt.close(fig)
-        buf.seek(0)
-        img_str = base64.b64encode(buf.read()).decode('utf-8')
+        img_str = base64.b64encode(buf.getbuffer()).decode('ascii')
         return f"data:image/png;base64,{img_str}"
 
 
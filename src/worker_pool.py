@@ -0,0 +1,33 @@
+"""
+Worker process counts for the analyses that can spread work over processes.
+
+BiasDetector, MetricsCalculator and ReportGenerator share this rule, so a
+worker count left unset behaves the same way everywhere.
+"""
+
+import os
+from typing import Optional
+
+
+# Independent tasks needed before processes are used automatically; below
+# this, starting workers and pickling their input costs more than it saves
+AUTO_PARALLEL_MIN_TASKS = 64
+
+
+def resolve_max_workers(max_workers: Optional[int], n_tasks: int,
+                        min_tasks: int = AUTO_PARALLEL_MIN_TASKS) -> int:
+    """Number of worker processes to spread n_tasks independent tasks over.
+
+    Args:
+        max_workers: Requested number of worker processes; when None, one per
+            CPU is used once there are at least min_tasks tasks
+        n_tasks: Number of independent tasks
+        min_tasks: Task count from which processes are used automatically
+
+    Returns:
+        Worker count between 1 and n_tasks; 1 means the tasks should run in
+        this process
+    """
+    if max_workers is None:
+        max_workers = (os.cpu_count() or 1) if n_tasks >= min_tasks else 1
+    return max(1, min(max_workers, n_tasks))